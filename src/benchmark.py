@@ -0,0 +1,293 @@
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.history import DEFAULT_HISTORY, BenchmarkHistory, report_comparison
+from src.memory import MemoryReport, track_memory
+from src.run import (
+    Unit,
+    discover_days,
+    discover_units,
+    load_solution,
+    parse_answer,
+    parse_range,
+)
+from src.timing import TimingStatistics
+
+PARSER = argparse.ArgumentParser(
+    description="Benchmark quest parts with repeated, warmed-up runs."
+)
+
+PARSER.add_argument("-y", "--year", help="Year of the event to run.", default="2025")
+PARSER.add_argument(
+    "-d", "--days", help="Days to run, e.g. `1-12` or `1,3,5-7`. Default is all."
+)
+PARSER.add_argument(
+    "-p", "--parts", help="Parts to run, e.g. `1-3` or `3`.", default="1-3"
+)
+PARSER.add_argument(
+    "-n", "--repeat", help="Number of measured runs per part.", type=int, default=10
+)
+PARSER.add_argument(
+    "-w", "--warmup", help="Number of discarded runs per part.", type=int, default=2
+)
+PARSER.add_argument(
+    "-i",
+    "--inputs",
+    help="Root folder of the input files.",
+    default="./inputs/everybody_codes",
+)
+PARSER.add_argument(
+    "-o",
+    "--output",
+    help="Folder to write the JSON results to.",
+    default="./benchmarks",
+)
+PARSER.add_argument("-l", "--label", help="Label to save the run under.")
+PARSER.add_argument(
+    "--history", help="SQLite file of the benchmark history.", default=DEFAULT_HISTORY
+)
+PARSER.add_argument(
+    "--no-history", help="Do not save the run.", action="store_true", default=False
+)
+PARSER.add_argument(
+    "-b", "--baseline", help="Label of a saved run to compare this run against."
+)
+PARSER.add_argument(
+    "-t",
+    "--threshold",
+    help="Allowed relative slowdown of the median before flagging, e.g. `0.1`.",
+    type=float,
+    default=0.1,
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing samples of a single unit."""
+
+    unit: Unit
+    answer: str | None = None
+    parse_samples_ns: list[int] = field(default_factory=list)
+    run_samples_ns: list[int] = field(default_factory=list)
+    peak_memory_bytes: int | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the unit was benchmarked without errors."""
+        return self.error is None
+
+    @property
+    def parse_stats(self) -> TimingStatistics:
+        """Statistics over the parse samples."""
+        return TimingStatistics(samples_ns=self.parse_samples_ns)
+
+    @property
+    def run_stats(self) -> TimingStatistics:
+        """Statistics over the run samples."""
+        return TimingStatistics(samples_ns=self.run_samples_ns)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the machine-readable representation of the result."""
+        res: dict[str, Any] = {
+            "year": self.unit.year,
+            "day": self.unit.day,
+            "part": self.unit.part,
+            "answer": self.answer,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "error": self.error,
+        }
+
+        if self.ok:
+            res["parse"] = self.parse_stats.as_dict()
+            res["run"] = self.run_stats.as_dict()
+            res["run_samples_ns"] = self.run_samples_ns
+
+        return res
+
+
+def sample_unit(unit: Unit, inputs: str) -> tuple[str, int, int]:
+    """Parse the input of the unit and run its part once.
+
+    A fresh instance is parsed for every sample, as several parts mutate their solution state.
+
+    Args:
+        unit (Unit): Unit to run.
+        inputs (str): Root folder of the input files.
+
+    Returns:
+        tuple[str, int, int]: The answer, parse time and run time in nanoseconds.
+    """
+    solution: type = load_solution(unit=unit)
+
+    start: int = time.perf_counter_ns()
+    instance = solution.parse(str(unit.input_path(inputs=inputs)))
+    parse_ns: int = time.perf_counter_ns() - start
+
+    output: io.StringIO = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        start = time.perf_counter_ns()
+        getattr(instance, unit.method_name)()
+        run_ns: int = time.perf_counter_ns() - start
+
+    return parse_answer(output=output.getvalue()), parse_ns, run_ns
+
+
+def sample_peak_memory(unit: Unit, inputs: str) -> int:
+    """Run the unit once under `tracemalloc`, returning the peak traced memory.
+
+    This is kept apart from the timed samples, as tracing slows down every allocation.
+
+    Args:
+        unit (Unit): Unit to run.
+        inputs (str): Root folder of the input files.
+
+    Returns:
+        int: Peak traced memory in bytes, covering both parsing and running.
+    """
+    report: MemoryReport
+    with track_memory() as report:
+        sample_unit(unit=unit, inputs=inputs)
+
+    return report.peak_traced_bytes
+
+
+def benchmark_unit(
+    unit: Unit, inputs: str, repeat: int = 10, warmup: int = 2
+) -> BenchmarkResult:
+    """Run the unit `warmup` times, discarding the timings, and then sample it `repeat` times.
+
+    Args:
+        unit (Unit): Unit to benchmark.
+        inputs (str): Root folder of the input files.
+        repeat (int): Number of measured runs. Default is `10`.
+        warmup (int): Number of discarded runs. Default is `2`.
+
+    Returns:
+        BenchmarkResult: Samples of the unit.
+    """
+    result: BenchmarkResult = BenchmarkResult(unit=unit)
+
+    try:
+        for _ in range(warmup):
+            sample_unit(unit=unit, inputs=inputs)
+
+        for _ in range(max(repeat, 1)):
+            answer, parse_ns, run_ns = sample_unit(unit=unit, inputs=inputs)
+
+            result.answer = answer
+            result.parse_samples_ns.append(parse_ns)
+            result.run_samples_ns.append(run_ns)
+
+        result.peak_memory_bytes = sample_peak_memory(unit=unit, inputs=inputs)
+
+    except Exception as ex:
+        result.error = f"{type(ex).__name__}: {ex}"
+
+    return result
+
+
+def write_result(result: BenchmarkResult, output: str) -> Path:
+    """Write the result as JSON to `<output>/<year>/<day>/part<part>.json`.
+
+    Args:
+        result (BenchmarkResult): Result to write.
+        output (str): Folder to write the results to.
+
+    Returns:
+        Path: Path of the written file.
+    """
+    path: Path = (
+        Path(output)
+        / str(result.unit.year)
+        / f"{result.unit.day:02d}"
+        / f"{result.unit.method_name}.json"
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "w") as file:
+        json.dump(result.as_dict(), file, indent=2)
+
+    return path
+
+
+def report(results: list[BenchmarkResult]) -> None:
+    """Print the results."""
+    for result in results:
+        if not result.ok:
+            print(f"{result.unit}: {result.error}")
+            continue
+
+        print(f"{result.unit}: {result.run_stats}")
+
+
+def main() -> None:
+    """Entry point."""
+    args = PARSER.parse_args()
+
+    if args.baseline and args.no_history:
+        PARSER.error("`--baseline` needs the run to be saved; drop `--no-history`.")
+
+    history: BenchmarkHistory | None = (
+        None if args.no_history else BenchmarkHistory(path=args.history)
+    )
+
+    try:
+        baseline_id: int | None = None
+
+        if history is not None and args.baseline:
+            # resolved up front, so an unknown label fails before any benchmark runs
+            try:
+                baseline_id = history.find_run(label=args.baseline)
+
+            except ValueError as ex:
+                PARSER.error(str(ex))
+
+        year: int = int(args.year)
+        days: list[int] = (
+            parse_range(args.days) if args.days else discover_days(year=year)
+        )
+        units: list[Unit] = discover_units(
+            year=year, days=days, parts=parse_range(args.parts)
+        )
+
+        results: list[BenchmarkResult] = []
+        for unit in units:
+            result: BenchmarkResult = benchmark_unit(
+                unit=unit, inputs=args.inputs, repeat=args.repeat, warmup=args.warmup
+            )
+            write_result(result=result, output=args.output)
+            results.append(result)
+
+        report(results=results)
+
+        if history is None:
+            return
+
+        run_id: int = history.save_run(results=results, label=args.label)
+        print(f"\nSaved run {run_id} to `{args.history}`.")
+
+        if baseline_id is not None:
+            print()
+            regressions: int = report_comparison(
+                comparisons=history.compare(baseline_id=baseline_id, current_id=run_id),
+                threshold=args.threshold,
+            )
+
+            if regressions:
+                sys.exit(1)
+
+    finally:
+        if history is not None:
+            history.close()
+
+
+if __name__ == "__main__":
+    main()
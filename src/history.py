@@ -0,0 +1,291 @@
+import argparse
+import platform
+import sqlite3
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime as dt
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.timing import Timing
+
+if TYPE_CHECKING:
+    from src.benchmark import BenchmarkResult
+
+DEFAULT_HISTORY: str = "./benchmarks/history.sqlite3"
+
+PARSER = argparse.ArgumentParser(description="Inspect the saved benchmark history.")
+PARSER.add_argument(
+    "--history", help="SQLite file of the benchmark history.", default=DEFAULT_HISTORY
+)
+
+SUBPARSERS = PARSER.add_subparsers(dest="command", required=True)
+
+LIST_PARSER = SUBPARSERS.add_parser("list", help="List the saved runs.")
+
+COMPARE_PARSER = SUBPARSERS.add_parser(
+    "compare", help="Compare a run against a baseline run."
+)
+COMPARE_PARSER.add_argument(
+    "-b", "--baseline", help="Label of the baseline run.", required=True
+)
+COMPARE_PARSER.add_argument(
+    "-c", "--current", help="Label of the run to check. Default is the latest run."
+)
+COMPARE_PARSER.add_argument(
+    "-t",
+    "--threshold",
+    help="Allowed relative slowdown of the median before flagging, e.g. `0.1`.",
+    type=float,
+    default=0.1,
+)
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT,
+    created_at TEXT NOT NULL,
+    commit_hash TEXT,
+    python_version TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    answer TEXT,
+    samples INTEGER NOT NULL,
+    min_ns REAL NOT NULL,
+    median_ns REAL NOT NULL,
+    mean_ns REAL NOT NULL,
+    p95_ns REAL NOT NULL,
+    stddev_ns REAL NOT NULL,
+    peak_memory_bytes INTEGER,
+    PRIMARY KEY (run_id, year, day, part)
+);
+"""
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Median comparison of a single (year, day, part) between two runs."""
+
+    year: int
+    day: int
+    part: int
+    baseline_median_ns: float
+    current_median_ns: float
+
+    @property
+    def change(self) -> float:
+        """Relative change of the median, positive when slower."""
+        return self.current_median_ns / self.baseline_median_ns - 1
+
+    def is_regression(self, threshold: float) -> bool:
+        """Whether the median slowed beyond the threshold.
+
+        Args:
+            threshold (float): Allowed relative slowdown.
+
+        Returns:
+            bool: Regressed or not.
+        """
+        return self.change > threshold
+
+
+def current_commit() -> str | None:
+    """Get the commit hash of the working tree, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class BenchmarkHistory:
+    """SQLite backed store of benchmark runs."""
+
+    def __init__(self, path: str = DEFAULT_HISTORY):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self.connection.close()
+
+    def save_run(
+        self, results: list["BenchmarkResult"], label: str | None = None
+    ) -> int:
+        """Persist the results of a benchmark run.
+
+        Args:
+            results (list[BenchmarkResult]): Results of the run. Failed units are skipped.
+            label (str | None): Name of the run, used to refer to it as a baseline.
+
+        Returns:
+            int: Id of the saved run.
+        """
+        with self.connection:
+            cursor: sqlite3.Cursor = self.connection.execute(
+                "INSERT INTO runs (label, created_at, commit_hash, python_version) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    label,
+                    dt.now().isoformat(timespec="seconds"),
+                    current_commit(),
+                    platform.python_version(),
+                ),
+            )
+            run_id: int = cursor.lastrowid or 0
+
+            for result in results:
+                if not result.ok:
+                    continue
+
+                stats: dict[str, int | float] = result.run_stats.as_dict()
+                self.connection.execute(
+                    "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        run_id,
+                        result.unit.year,
+                        result.unit.day,
+                        result.unit.part,
+                        result.answer,
+                        stats["count"],
+                        stats["min_ns"],
+                        stats["median_ns"],
+                        stats["mean_ns"],
+                        stats["p95_ns"],
+                        stats["stddev_ns"],
+                        result.peak_memory_bytes,
+                    ),
+                )
+
+        return run_id
+
+    def find_run(self, label: str | None = None) -> int:
+        """Get the id of the latest run with the given label, or of the latest run overall.
+
+        Args:
+            label (str | None): Label of the run.
+
+        Returns:
+            int: Id of the run.
+        """
+        if label is None:
+            row = self.connection.execute("SELECT MAX(id) FROM runs").fetchone()
+
+        else:
+            row = self.connection.execute(
+                "SELECT MAX(id) FROM runs WHERE label = ?", (label,)
+            ).fetchone()
+
+        if row is None or row[0] is None:
+            raise ValueError(f"No benchmark run found for label: {label or 'latest'}.")
+
+        return row[0]
+
+    def list_runs(self) -> list[tuple[int, str | None, str, str | None, str]]:
+        """Get all saved runs as (id, label, created at, commit hash, python version)."""
+        return self.connection.execute(
+            "SELECT id, label, created_at, commit_hash, python_version FROM runs ORDER BY id"
+        ).fetchall()
+
+    def compare(self, baseline_id: int, current_id: int) -> list[Comparison]:
+        """Compare the medians of all (year, day, part) present in both runs.
+
+        Args:
+            baseline_id (int): Id of the baseline run.
+            current_id (int): Id of the run to check.
+
+        Returns:
+            list[Comparison]: Comparison of each shared (year, day, part).
+        """
+        rows = self.connection.execute(
+            "SELECT b.year, b.day, b.part, b.median_ns, c.median_ns "
+            "FROM results b JOIN results c USING (year, day, part) "
+            "WHERE b.run_id = ? AND c.run_id = ? "
+            "ORDER BY b.year, b.day, b.part",
+            (baseline_id, current_id),
+        ).fetchall()
+
+        return [
+            Comparison(
+                year=year,
+                day=day,
+                part=part,
+                baseline_median_ns=baseline,
+                current_median_ns=current,
+            )
+            for year, day, part, baseline, current in rows
+        ]
+
+
+def report_comparison(comparisons: list[Comparison], threshold: float) -> int:
+    """Print the comparisons, returning the number of regressions.
+
+    Args:
+        comparisons (list[Comparison]): Comparisons to print.
+        threshold (float): Allowed relative slowdown.
+
+    Returns:
+        int: Number of regressed parts.
+    """
+    regressions: int = 0
+
+    for comparison in comparisons:
+        regressed: bool = comparison.is_regression(threshold=threshold)
+        regressions += regressed
+
+        print(
+            f"{comparison.year}/{comparison.day:02d} part{comparison.part:02d}: "
+            f"{Timing(comparison.baseline_median_ns / 1e9).scaled()} -> "
+            f"{Timing(comparison.current_median_ns / 1e9).scaled()} "
+            f"({comparison.change:+.1%}){' REGRESSION' if regressed else ''}"
+        )
+
+    print(f"\n{regressions} regression(s) beyond {threshold:.0%}.")
+    return regressions
+
+
+def main() -> None:
+    """Entry point."""
+    args = PARSER.parse_args()
+    history: BenchmarkHistory = BenchmarkHistory(path=args.history)
+
+    try:
+        match args.command:
+            case "list":
+                for run in history.list_runs():
+                    print(" | ".join("-" if x is None else str(x) for x in run))
+
+            case "compare":
+                try:
+                    baseline_id: int = history.find_run(label=args.baseline)
+                    current_id: int = history.find_run(label=args.current)
+
+                except ValueError as ex:
+                    PARSER.error(str(ex))
+
+                comparisons: list[Comparison] = history.compare(
+                    baseline_id=baseline_id, current_id=current_id
+                )
+
+                if report_comparison(comparisons=comparisons, threshold=args.threshold):
+                    sys.exit(1)
+
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import contextlib
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Iterator
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """Memory still allocated by a single source line."""
+
+    location: str
+    size: int
+    count: int
+
+    def __str__(self) -> str:
+        return f"{self.location}: {format_bytes(self.size)} in {self.count} blocks"
+
+
+@dataclass
+class MemoryReport:
+    """Memory usage measured while running a block of code."""
+
+    peak_traced_bytes: int = 0
+    peak_rss_bytes: int | None = None
+    top_allocations: list[AllocationSite] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        rss: str = (
+            "-" if self.peak_rss_bytes is None else format_bytes(self.peak_rss_bytes)
+        )
+        return f"peak traced={format_bytes(self.peak_traced_bytes)}; peak rss={rss}"
+
+
+def format_bytes(size: int) -> str:
+    """Format a number of bytes using binary units.
+
+    Args:
+        size (int): Number of bytes.
+
+    Returns:
+        str: Human readable size.
+    """
+    value: float = size
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.1f}{unit}"
+        value /= 1024
+
+    return f"{value:.1f}GiB"
+
+
+def peak_rss_bytes() -> int | None:
+    """Get the peak resident set size of the current process, if available."""
+    if resource is None:
+        return None
+
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # reported in bytes on macOS, but in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextlib.contextmanager
+def track_memory(top: int = 0) -> Iterator[MemoryReport]:
+    """Trace the allocations made within the block, filling in the yielded report when the block exits.
+
+    The peak RSS covers the whole process lifetime, so it is only attributable to the block when run in a fresh process.
+
+    Args:
+        top (int): Number of allocation sites still holding the most memory at the end of the block to report.
+
+    Yields:
+        MemoryReport: Report of the memory used by the block.
+    """
+    report: MemoryReport = MemoryReport()
+    tracemalloc.start()
+
+    try:
+        yield report
+
+        _, report.peak_traced_bytes = tracemalloc.get_traced_memory()
+
+        if top:
+            snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot().filter_traces(
+                (
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                )
+            )
+            report.top_allocations = [
+                AllocationSite(
+                    location=f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    size=stat.size,
+                    count=stat.count,
+                )
+                for stat in snapshot.statistics("lineno")[:top]
+            ]
+
+    finally:
+        tracemalloc.stop()
+        report.peak_rss_bytes = peak_rss_bytes()
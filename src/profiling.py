@@ -0,0 +1,129 @@
+import cProfile
+import os
+import pstats
+from pathlib import Path
+from typing import Any, Callable
+
+FunctionKey = tuple[str, int, str]
+
+
+def function_label(func: FunctionKey) -> str:
+    """Get a readable label for a profiled function, e.g. `day10.py:167(determine_moves_to_eat_all_sheep)`.
+
+    Args:
+        func (FunctionKey): Profiled function as (file, line number, name).
+
+    Returns:
+        str: Label of the function.
+    """
+    file, lineno, name = func
+
+    if file == "~" and lineno == 0:
+        return name
+
+    return f"{os.path.basename(file)}:{lineno}({name})"
+
+
+def is_profiler_frame(func: FunctionKey) -> bool:
+    """Whether a profiled function belongs to the profiler itself, such as the `disable` call ending a profile.
+
+    Args:
+        func (FunctionKey): Profiled function as (file, line number, name).
+
+    Returns:
+        bool: Profiler-internal function or not.
+    """
+    file, lineno, name = func
+    return file == "~" and lineno == 0 and "_lsprof.Profiler" in name
+
+
+def collapsed_stacks(
+    stats: pstats.Stats, max_depth: int = 64, min_seconds: float = 1e-6
+) -> dict[str, float]:
+    """Rebuild collapsed stacks (flamegraph format) from the caller graph of a profile.
+
+    `cProfile` only records caller-callee edges, so the time of a function is split over the paths leading to it in
+    proportion to the cumulative time of each incoming edge. Recursive calls are cut at the first repeat, and the
+    profiler's own frames are left out.
+
+    Args:
+        stats (pstats.Stats): Loaded profile statistics.
+        max_depth (int): Maximum depth of a stack. Default is `64`.
+        min_seconds (float): Paths with less attributed time are dropped. Default is `1e-6`.
+
+    Returns:
+        dict[str, float]: Self time in seconds of each `;` separated stack.
+    """
+    entries: dict[FunctionKey, Any] = stats.stats  # type: ignore[attr-defined]
+    callees: dict[FunctionKey, list[FunctionKey]] = {func: [] for func in entries}
+
+    for func, (*_, callers) in entries.items():
+        for caller in callers:
+            if caller in callees:
+                callees[caller].append(func)
+
+    res: dict[str, float] = {}
+
+    def visit(func: FunctionKey, stack: list[str], scale: float, path: set) -> None:
+        _, _, self_time, total_time, _ = entries[func]
+        stack = stack + [function_label(func=func)]
+
+        if self_time * scale >= min_seconds:
+            key: str = ";".join(stack)
+            res[key] = res.get(key, 0) + self_time * scale
+
+        if len(stack) >= max_depth:
+            return
+
+        for callee in callees[func]:
+            if callee in path:
+                continue
+
+            callee_total: float = entries[callee][3]
+            edge_total: float = entries[callee][4][func][3]
+
+            if callee_total <= 0 or edge_total * scale < min_seconds:
+                continue
+
+            visit(
+                func=callee,
+                stack=stack,
+                scale=scale * edge_total / callee_total,
+                path=path | {callee},
+            )
+
+    for func, (*_, callers) in entries.items():
+        if is_profiler_frame(func=func):
+            continue
+
+        if not any(caller in entries for caller in callers):
+            visit(func=func, stack=[], scale=1, path={func})
+
+    return res
+
+
+def profile_call(func: Callable[[], Any], output: Path) -> Any:
+    """Run `func` under `cProfile`, writing `<output>.pstats` and `<output>.collapsed`.
+
+    Args:
+        func (Callable[[], Any]): Function to profile.
+        output (Path): Path of the output files, without an extension.
+
+    Returns:
+        Any: Return value of `func`.
+    """
+    profile: cProfile.Profile = cProfile.Profile()
+
+    try:
+        return profile.runcall(func)
+
+    finally:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(output.with_suffix(".pstats"))
+
+        stacks: dict[str, float] = collapsed_stacks(stats=pstats.Stats(profile))
+
+        with open(output.with_suffix(".collapsed"), "w") as file:
+            for stack, seconds in sorted(stacks.items()):
+                # flamegraph tools expect integer sample counts; microseconds are used
+                file.write(f"{stack} {max(round(seconds * 1e6), 1)}\n")
@@ -0,0 +1,64 @@
+import argparse
+import importlib
+import itertools
+import timeit
+
+from src.timing import Timing
+
+day02 = importlib.import_module("src.python.2025.02.day02")
+
+PARSER = argparse.ArgumentParser(
+    description="Compare the `ComplexNumber` and plain integer escape kernels of 2025/02."
+)
+
+PARSER.add_argument(
+    "-s", "--size", help="Width and height of the sampled grid.", type=int, default=31
+)
+PARSER.add_argument(
+    "-n", "--repeat", help="Number of measured runs per kernel.", type=int, default=5
+)
+
+
+def main() -> None:
+    """Entry point."""
+    args = PARSER.parse_args()
+
+    # the part02 grid of the example input, which mixes escaping and valid points
+    solution = day02.Solution(data=day02.ComplexNumber(x=35300, y=-64910))
+    step_count: int = 1000 // max(args.size - 1, 1)
+    points: list[tuple[int, int]] = [
+        (solution.data.x + step_count * dx, solution.data.y + step_count * dy)
+        for dx, dy in itertools.product(range(args.size), repeat=2)
+    ]
+
+    kernels = {
+        "ComplexNumber": lambda: [
+            solution._escape_cycle(target_x=x, target_y=y) for x, y in points
+        ],
+        "integer": lambda: [
+            day02.escape_cycle(target_x=x, target_y=y) for x, y in points
+        ],
+    }
+
+    results: list[list[int]] = [kernel() for kernel in kernels.values()]
+    if any(result != results[0] for result in results):
+        raise ValueError("The kernels disagree on the escape cycles.")
+
+    best: dict[str, float] = {
+        name: min(timeit.repeat(kernel, number=1, repeat=args.repeat))
+        for name, kernel in kernels.items()
+    }
+
+    for name, seconds in best.items():
+        print(
+            f"{name:<15} {Timing(seconds).result()} "
+            f"({seconds / len(points) * 1e6:.2f}µs per point)"
+        )
+
+    print(
+        f"\nSpeedup: {best['ComplexNumber'] / best['integer']:.1f}x over {len(points)} points."
+    )
+
+
+if __name__ == "__main__":
+    main()
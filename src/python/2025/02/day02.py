@@ -1,6 +1,31 @@
 import itertools
+import random
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from src.python.common.cache import cached_parse
+from src.python.common.parallel import WORKERS, chunk_count
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    try:
+        import numpy as np
+    except (
+        ImportError
+    ):  # NumPy is optional (`numpy` extra); the scalar engine is used without it
+        np = None
+
+HAS_NUMPY: bool = np is not None
+
+ESCAPE_LIMIT: int = 1000000
+DIVIDE_AMOUNT: int = 100000
+CYCLES: int = 100
+
+# filled points the `boundary` engine evaluates again to check its count
+CROSS_CHECK_SAMPLES: int = 1000
 
 
 @dataclass
@@ -61,6 +86,261 @@ class ComplexNumber:
         self.x, self.y = x, y
 
 
+def escape_cycle(target_x: int, target_y: int) -> int:
+    """Determine the cycle in which the point with the given target escapes, using plain integers.
+
+    This is `Solution._escape_cycle` without the `ComplexNumber` objects and method calls, for the scalar engines.
+
+    Args:
+        target_x (int): X coordinate of the target point.
+        target_y (int): Y coordinate of the target point.
+
+    Returns:
+        int: The 1-based cycle in which the point escaped, or `0` if it is a valid point.
+    """
+    x: int = 0
+    y: int = 0
+
+    for cycle in range(1, CYCLES + 1):
+        square_x: int = x * x - y * y
+        square_y: int = 2 * x * y
+
+        # divisions round towards zero, as in `ComplexNumber._negative_divide`
+        if square_x >= 0:
+            x = square_x // DIVIDE_AMOUNT + target_x
+        else:
+            x = -(-square_x // DIVIDE_AMOUNT) + target_x
+
+        if square_y >= 0:
+            y = square_y // DIVIDE_AMOUNT + target_y
+        else:
+            y = -(-square_y // DIVIDE_AMOUNT) + target_y
+
+        if (
+            x > ESCAPE_LIMIT
+            or x < -ESCAPE_LIMIT
+            or y > ESCAPE_LIMIT
+            or y < -ESCAPE_LIMIT
+        ):
+            return cycle
+
+    return 0
+
+
+def rectangle_border(x0: int, x1: int, y0: int, y1: int) -> list[tuple[int, int]]:
+    """Get the cells on the border of the half-open rectangle `[x0, x1)` by `[y0, y1)`.
+
+    Args:
+        x0 (int): First row of the rectangle.
+        x1 (int): Row past the last row of the rectangle.
+        y0 (int): First column of the rectangle.
+        y1 (int): Column past the last column of the rectangle.
+
+    Returns:
+        list[tuple[int, int]]: Border cells as (dx, dy), each listed once.
+    """
+    return [
+        *((dx, dy) for dx in (x0, x1 - 1) for dy in range(y0, y1)),
+        *((dx, dy) for dy in (y0, y1 - 1) for dx in range(x0 + 1, x1 - 1)),
+    ]
+
+
+def _escape_iterations_numpy(target_x: Any, target_y: Any) -> Any:
+    """Run the engraving cycles for every given target point at once.
+
+    The points are kept as float64, which represents every intermediate value exactly: points are dropped as soon as
+    they escape, so no product exceeds `2 * ESCAPE_LIMIT ** 2`, well below `2 ** 53`. Truncating the quotient matches
+    the rounding towards zero of `ComplexNumber._negative_divide`, while avoiding NumPy's slow integer division.
+
+    Args:
+        target_x (Any): NumPy array of the x coordinate of each target point.
+        target_y (Any): NumPy array of the y coordinate of each target point.
+
+    Returns:
+        Any: NumPy array of the 1-based cycle in which each point escaped, or `0` if it never escaped.
+    """
+    target_x = np.array(target_x, dtype=np.float64).ravel()
+    target_y = np.array(target_y, dtype=np.float64).ravel()
+
+    res = np.zeros(target_x.size, dtype=np.int16)
+    indices = np.arange(target_x.size)
+    x = np.zeros_like(target_x)
+    y = np.zeros_like(target_y)
+    buffer = np.empty_like(target_x)
+
+    for cycle in range(1, CYCLES + 1):
+        # y = trunc(2xy / d) + ty, computed before x is overwritten
+        np.multiply(x, y, out=buffer)
+        buffer *= 2
+        buffer /= DIVIDE_AMOUNT
+
+        # x = trunc((x^2 - y^2) / d) + tx
+        x *= x
+        y *= y
+        x -= y
+        x /= DIVIDE_AMOUNT
+        np.trunc(x, out=x)
+        x += target_x
+
+        np.trunc(buffer, out=y)
+        y += target_y
+
+        np.abs(x, out=buffer)
+        escaped = buffer > ESCAPE_LIMIT
+        np.abs(y, out=buffer)
+        escaped |= buffer > ESCAPE_LIMIT
+
+        if escaped.any():
+            res[indices[escaped]] = cycle
+
+            remaining = ~escaped
+            x, y = x[remaining], y[remaining]
+            target_x, target_y = target_x[remaining], target_y[remaining]
+            indices = indices[remaining]
+            buffer = np.empty_like(x)
+
+            if not indices.size:
+                break
+
+    return res
+
+
+def _lattice_overlap(
+    origin: int,
+    step_count: int,
+    size: int,
+    cached_origin: int,
+    cached_step: int,
+    cached_size: int,
+) -> tuple[Any, Any]:
+    """Match the points of a one-dimensional lattice against the points of a cached lattice.
+
+    Args:
+        origin (int): First point of the lattice.
+        step_count (int): Step count between points of the lattice.
+        size (int): Number of points of the lattice.
+        cached_origin (int): First point of the cached lattice.
+        cached_step (int): Step count between points of the cached lattice.
+        cached_size (int): Number of points of the cached lattice.
+
+    Returns:
+        tuple[Any, Any]: NumPy arrays of the indices of the shared points in the lattice and in the cached lattice.
+    """
+    offsets = origin - cached_origin + step_count * np.arange(size, dtype=np.int64)
+    src = offsets // cached_step
+    shared = (offsets % cached_step == 0) & (src >= 0) & (src < cached_size)
+
+    return np.flatnonzero(shared), src[shared]
+
+
+class EscapeIterationCache:
+    """Escape cycle matrices of earlier evaluated grids, reused for every grid sharing points with them.
+
+    The escape cycle of a point does not depend on the grid it is part of, so entries are keyed on the origin, step
+    count and size of their grid, and any other grid is served the points it shares with them, be it a sub-lattice
+    (e.g. part02's step 10 grid within part03's step 1 grid) or an overlapping window.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries: int = max_entries
+        self.entries: dict[tuple[int, int, int, int, int], Any] = {}
+
+    def lookup(
+        self, origin_x: int, origin_y: int, step_count: int, x: int, y: int
+    ) -> Any:
+        """Collect the known escape cycles of a grid of `x` by `y`.
+
+        Args:
+            origin_x (int): X coordinate of the first point of the grid.
+            origin_y (int): Y coordinate of the first point of the grid.
+            step_count (int): Step count between points.
+            x (int): Width of the grid.
+            y (int): Height of the grid.
+
+        Returns:
+            Any: NumPy array of shape `(x, y)` with the escape cycle of each point, or `-1` for unknown points.
+        """
+        key: tuple[int, int, int, int, int] = (origin_x, origin_y, step_count, x, y)
+
+        if key in self.entries:
+            # move the entry to the back, so it is evicted last
+            self.entries[key] = self.entries.pop(key)
+            return self.entries[key].copy()
+
+        res = np.full((x, y), -1, dtype=np.int16)
+
+        for (
+            cached_x,
+            cached_y,
+            cached_step,
+            cached_width,
+            cached_height,
+        ), matrix in self.entries.items():
+            rows, cached_rows = _lattice_overlap(
+                origin=origin_x,
+                step_count=step_count,
+                size=x,
+                cached_origin=cached_x,
+                cached_step=cached_step,
+                cached_size=cached_width,
+            )
+            columns, cached_columns = _lattice_overlap(
+                origin=origin_y,
+                step_count=step_count,
+                size=y,
+                cached_origin=cached_y,
+                cached_step=cached_step,
+                cached_size=cached_height,
+            )
+
+            if rows.size and columns.size:
+                res[np.ix_(rows, columns)] = matrix[np.ix_(cached_rows, cached_columns)]
+
+        return res
+
+    def store(self, origin_x: int, origin_y: int, step_count: int, matrix: Any) -> None:
+        """Store the escape cycles of a grid, evicting the least recently used entries beyond `max_entries`.
+
+        Args:
+            origin_x (int): X coordinate of the first point of the grid.
+            origin_y (int): Y coordinate of the first point of the grid.
+            step_count (int): Step count between points.
+            matrix (Any): NumPy array with the escape cycle of each point of the grid.
+        """
+        x, y = matrix.shape
+        self.entries[(origin_x, origin_y, step_count, x, y)] = matrix.copy()
+
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.entries.clear()
+
+
+ESCAPE_CACHE: EscapeIterationCache = EscapeIterationCache()
+
+
+def _count_valid_points_tile(
+    origin_x: int, origin_y: int, x: int, y: int, step_count: int, engine: str | None
+) -> int:
+    """Count the valid points of a single tile of the grid, for use in a worker process.
+
+    Args:
+        origin_x (int): X coordinate of the first point of the tile.
+        origin_y (int): Y coordinate of the first point of the tile.
+        x (int): Width of the tile.
+        y (int): Height of the tile.
+        step_count (int): Step count between points.
+        engine (str | None): Engine used to evaluate the tile.
+
+    Returns:
+        int: Number of valid points in the tile.
+    """
+    tile: Solution = Solution(data=ComplexNumber(x=origin_x, y=origin_y))
+    return tile._count_valid_points(x=x, y=y, step_count=step_count, engine=engine)
+
+
 class Solution:
     """Solution to the problem."""
 
@@ -68,6 +348,7 @@ class Solution:
         self.data: ComplexNumber = data
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
@@ -100,43 +381,356 @@ class Solution:
         Returns:
             bool: Valid point or not.
         """
-        return abs(complex_number.x) > 1000000 or abs(complex_number.y) > 1000000
+        return (
+            abs(complex_number.x) > ESCAPE_LIMIT or abs(complex_number.y) > ESCAPE_LIMIT
+        )
 
-    def _count_valid_points(self, x: int, y: int, step_count: int = 1) -> int:
+    def _escape_cycle(self, target_x: int, target_y: int) -> int:
+        """Determine the cycle in which the point with the given target escapes, using `ComplexNumber`.
+
+        This is the readable reference of `escape_cycle`, which the engines use.
+
+        Args:
+            target_x (int): X coordinate of the target point.
+            target_y (int): Y coordinate of the target point.
+
+        Returns:
+            int: The 1-based cycle in which the point escaped, or `0` if it is a valid point.
+        """
+        divide_amount: ComplexNumber = ComplexNumber(x=DIVIDE_AMOUNT, y=DIVIDE_AMOUNT)
+        complex_number: ComplexNumber = ComplexNumber(x=0, y=0)
+        target_point: ComplexNumber = ComplexNumber(x=target_x, y=target_y)
+
+        for cycle in range(1, CYCLES + 1):
+            complex_number *= complex_number
+            complex_number /= divide_amount
+            complex_number += target_point
+
+            if self._is_invalid_point(complex_number=complex_number):
+                return cycle
+
+        return 0
+
+    def _evaluate_cells(
+        self, cells: list[tuple[int, int]], step_count: int
+    ) -> list[int]:
+        """Determine the escape cycle of each of the given grid cells.
+
+        Args:
+            cells (list[tuple[int, int]]): Grid cells as (dx, dy).
+            step_count (int): Step count between points.
+
+        Returns:
+            list[int]: The 1-based escape cycle of each cell, or `0` for valid points.
+        """
+        if not HAS_NUMPY:
+            return [
+                escape_cycle(
+                    target_x=self.data.x + step_count * dx,
+                    target_y=self.data.y + step_count * dy,
+                )
+                for dx, dy in cells
+            ]
+
+        offsets = np.array(cells, dtype=np.int64).reshape(-1, 2) * step_count
+        return _escape_iterations_numpy(
+            target_x=self.data.x + offsets[:, 0], target_y=self.data.y + offsets[:, 1]
+        ).tolist()
+
+    def _count_valid_points_boundary(
+        self, x: int, y: int, step_count: int = 1, min_size: int = 4, samples: int = 0
+    ) -> tuple[int, int]:
+        """Count the valid points with Mariani-Silver rectangle subdivision.
+
+        Only the border of a rectangle is evaluated. When every border point is valid, the ring just inside the border
+        is evaluated as a guard, and when it is valid too, the rest of the interior is filled as valid without being
+        evaluated, else the rectangle is split in two along its longer side, with both halves sharing the split line.
+        Escaping regions are always evaluated: a border of equal escape cycles does not rule out thin valid features
+        inside, and escaping points are cheap to evaluate anyway. The borders and guards of all rectangles of a
+        subdivision level are evaluated together. On part03's grid, about two thirds of the points are evaluated, which
+        run half of the cycles of the brute force.
+
+        Args:
+            x (int): Width of the grid.
+            y (int): Height of the grid.
+            step_count (int): Step count between points.
+            min_size (int): Rectangles with a side of at most this size are evaluated in full. Default is `4`.
+            samples (int): Number of filled points to evaluate afterwards, raising a `ValueError` if any of them is not
+                valid. Default is `0`.
+
+        Returns:
+            tuple[int, int]: Number of valid points, and the number of points that were evaluated.
+        """
+        # escape cycle of every cell, either evaluated or inferred from a valid border and guard, or `unknown`
+        unknown: int = 255
+        outcomes: bytearray = bytearray([unknown]) * (x * y)
+        evaluated: int = 0
+        filled: list[tuple[int, int, int, int]] = []
+
+        def evaluate(cells_per_rectangle: list[list[tuple[int, int]]]) -> None:
+            nonlocal evaluated
+
+            pending: list[tuple[int, int]] = list(
+                {
+                    (dx, dy): None
+                    for cells in cells_per_rectangle
+                    for dx, dy in cells
+                    if outcomes[dx * y + dy] == unknown
+                }
+            )
+            evaluated += len(pending)
+
+            for (dx, dy), cycle in zip(
+                pending, self._evaluate_cells(cells=pending, step_count=step_count)
+            ):
+                outcomes[dx * y + dy] = cycle
+
+        def is_valid(cells: list[tuple[int, int]]) -> bool:
+            return not any(outcomes[dx * y + dy] for dx, dy in cells)
+
+        # rectangles are half-open: [x0, x1) by [y0, y1)
+        rectangles: list[tuple[int, int, int, int]] = [(0, x, 0, y)]
+
+        while rectangles:
+            small: list[tuple[int, int, int, int]] = []
+            large: list[tuple[int, int, int, int]] = []
+
+            for x0, x1, y0, y1 in rectangles:
+                if x1 - x0 <= min_size or y1 - y0 <= min_size:
+                    small.append((x0, x1, y0, y1))
+                else:
+                    large.append((x0, x1, y0, y1))
+
+            borders: list[list[tuple[int, int]]] = [
+                rectangle_border(*rectangle) for rectangle in large
+            ]
+            evaluate(
+                [
+                    *(
+                        list(itertools.product(range(x0, x1), range(y0, y1)))
+                        for x0, x1, y0, y1 in small
+                    ),
+                    *borders,
+                ]
+            )
+
+            candidates: list[tuple[int, int, int, int]] = [
+                rectangle
+                for rectangle, border in zip(large, borders)
+                if is_valid(cells=border)
+            ]
+            guards: list[list[tuple[int, int]]] = [
+                rectangle_border(x0 + 1, x1 - 1, y0 + 1, y1 - 1)
+                for x0, x1, y0, y1 in candidates
+            ]
+            evaluate(guards)
+
+            next_rectangles: list[tuple[int, int, int, int]] = []
+            fillable: set[tuple[int, int, int, int]] = {
+                rectangle
+                for rectangle, guard in zip(candidates, guards)
+                if is_valid(cells=guard)
+            }
+
+            for x0, x1, y0, y1 in large:
+                # guards of earlier levels may have left evaluated escaping cells inside the interior
+                if (x0, x1, y0, y1) in fillable and not any(
+                    outcomes[dx * y + y0 + 2 : dx * y + y1 - 2].translate(
+                        None, bytes([0, unknown])
+                    )
+                    for dx in range(x0 + 2, x1 - 2)
+                ):
+                    for dx in range(x0 + 2, x1 - 2):
+                        outcomes[dx * y + y0 + 2 : dx * y + y1 - 2] = bytes(y1 - y0 - 4)
+
+                    filled.append((x0 + 2, x1 - 2, y0 + 2, y1 - 2))
+
+                elif x1 - x0 >= y1 - y0:
+                    mid: int = (x0 + x1) // 2
+                    next_rectangles.extend([(x0, mid + 1, y0, y1), (mid, x1, y0, y1)])
+
+                else:
+                    mid = (y0 + y1) // 2
+                    next_rectangles.extend([(x0, x1, y0, mid + 1), (x0, x1, mid, y1)])
+
+            rectangles = next_rectangles
+
+        if samples and filled:
+            rng: random.Random = random.Random(0)
+            checked: list[tuple[int, int]] = [
+                (rng.randrange(x0, x1), rng.randrange(y0, y1))
+                for x0, x1, y0, y1 in rng.choices(
+                    filled,
+                    weights=[(x1 - x0) * (y1 - y0) for x0, x1, y0, y1 in filled],
+                    k=samples,
+                )
+            ]
+            evaluated += len(checked)
+
+            if any(self._evaluate_cells(cells=checked, step_count=step_count)):
+                raise ValueError(
+                    "Boundary tracing filled a point that escapes; evaluate the grid with another engine."
+                )
+
+        return outcomes.count(0), evaluated
+
+    def escape_iterations(
+        self, x: int, y: int, step_count: int = 1, workers: int = 1
+    ) -> Any:
+        """Determine the cycle in which each point of a grid of `x` by `y` escapes. Requires NumPy.
+
+        Points already evaluated for an earlier grid are served from `ESCAPE_CACHE`, and only the others are computed.
+
+        Args:
+            x (int): Width of the grid.
+            y (int): Height of the grid.
+            step_count (int): Step count between points.
+            workers (int): Number of processes to split the computed points over. Default is `1`.
+
+        Returns:
+            Any: NumPy array of shape `(x, y)` with the 1-based escape cycle of each point, or `0` for valid points.
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for the escape iteration matrix.")
+
+        res = ESCAPE_CACHE.lookup(
+            origin_x=self.data.x, origin_y=self.data.y, step_count=step_count, x=x, y=y
+        )
+        rows, columns = np.nonzero(res < 0)
+
+        if not rows.size:
+            return res
+
+        target_x = self.data.x + step_count * rows.astype(np.int64)
+        target_y = self.data.y + step_count * columns.astype(np.int64)
+
+        if workers > 1 and rows.size > 1:
+            chunks: int = chunk_count(items=rows.size, workers=workers)
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                res[rows, columns] = np.concatenate(
+                    list(
+                        executor.map(
+                            _escape_iterations_numpy,
+                            np.array_split(target_x, chunks),
+                            np.array_split(target_y, chunks),
+                        )
+                    )
+                )
+
+        else:
+            res[rows, columns] = _escape_iterations_numpy(
+                target_x=target_x, target_y=target_y
+            )
+
+        ESCAPE_CACHE.store(
+            origin_x=self.data.x,
+            origin_y=self.data.y,
+            step_count=step_count,
+            matrix=res,
+        )
+
+        return res
+
+    def _count_valid_points(
+        self,
+        x: int,
+        y: int,
+        step_count: int = 1,
+        engine: str | None = None,
+        workers: int = 1,
+        cross_check: bool = True,
+    ) -> int:
         """Determine the numbr of valid points given a grid size of `x` by `y`.
 
         Args:
             x (int): Width of the grid.
             y (int): Height of the grid.
             step_count (int): Step count between points.
+            engine (str | None): `numpy` to evaluate the whole grid at once, `scalar` to evaluate point by point, or
+                `boundary` to skip the interior of valid rectangles. Default is `numpy` when it is installed, else
+                `scalar`.
+            workers (int): Number of processes to split the grid over. Default is `1`.
+            cross_check (bool): Evaluate a sample of the points the `boundary` engine filled, raising a `ValueError`
+                if any of them escapes. Default is TRUE.
 
         Returns:
             int: Total number of valid points in the grid.
         """
-        divide_amount: ComplexNumber = ComplexNumber(x=100000, y=100000)
-        complex_number: ComplexNumber = ComplexNumber(x=0, y=0)
-        target_point: ComplexNumber = ComplexNumber(x=0, y=0)
+        if engine == "boundary":
+            tlt, _ = self._count_valid_points_boundary(
+                x=x,
+                y=y,
+                step_count=step_count,
+                samples=CROSS_CHECK_SAMPLES if cross_check else 0,
+            )
+            return tlt
+
+        if engine is None:
+            engine = "numpy" if HAS_NUMPY else "scalar"
+
+        match engine:
+            case "numpy":
+                return int(
+                    np.count_nonzero(
+                        self.escape_iterations(
+                            x=x, y=y, step_count=step_count, workers=workers
+                        )
+                        == 0
+                    )
+                )
 
-        tlt: int = 0
-        for dx, dy in itertools.product(range(x), range(y)):
-            complex_number.set(x=0, y=0)
-            target_point.set(
-                x=self.data.x + step_count * dx, y=self.data.y + step_count * dy
+            case "scalar":
+                if workers > 1 and x > 1:
+                    return self._count_valid_points_parallel(
+                        x=x, y=y, step_count=step_count, engine=engine, workers=workers
+                    )
+
+            case _:
+                raise ValueError(f"Unknown engine: {engine}.")
+
+        return sum(
+            escape_cycle(
+                target_x=self.data.x + step_count * dx,
+                target_y=self.data.y + step_count * dy,
             )
+            == 0
+            for dx, dy in itertools.product(range(x), range(y))
+        )
 
-            valid: bool = True
-            for _ in range(100):
-                complex_number *= complex_number
-                complex_number /= divide_amount
-                complex_number += target_point
+    def _count_valid_points_parallel(
+        self, x: int, y: int, step_count: int, engine: str | None, workers: int
+    ) -> int:
+        """Count the valid points by splitting the grid into row tiles, evaluated over a process pool.
 
-                if self._is_invalid_point(complex_number=complex_number):
-                    valid = False
-                    break
+        Only the origin of each tile and the step count are sent to the workers. The tiles are summed in order, so the
+        result does not depend on the scheduling.
 
-            tlt += valid
+        Args:
+            x (int): Width of the grid.
+            y (int): Height of the grid.
+            step_count (int): Step count between points.
+            engine (str | None): Engine used to evaluate each tile.
+            workers (int): Number of processes.
 
-        return tlt
+        Returns:
+            int: Total number of valid points in the grid.
+        """
+        tile_count: int = chunk_count(items=x, workers=workers)
+        bounds: list[int] = [x * i // tile_count for i in range(tile_count + 1)]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return sum(
+                executor.map(
+                    _count_valid_points_tile,
+                    [self.data.x + step_count * start for start in bounds[:-1]],
+                    [self.data.y] * tile_count,
+                    [stop - start for start, stop in itertools.pairwise(bounds)],
+                    [y] * tile_count,
+                    [step_count] * tile_count,
+                    [engine] * tile_count,
+                )
+            )
 
     def part01(self) -> None:
         """Solve Part 01."""
@@ -154,9 +748,15 @@ class Solution:
         """Solve Part 02."""
         print(f"Part 02: {self._count_valid_points(x=101, y=101, step_count=10)}")
 
-    def part03(self) -> None:
-        """Solve Part 03."""
-        print(f"Part 03: {self._count_valid_points(x=1001, y=1001)}")
+    def part03(self, workers: int = WORKERS) -> None:
+        """Solve Part 03.
+
+        Args:
+            workers (int): Number of processes to split the grid over. Default is `EC_WORKERS`, else `1`.
+        """
+        tlt: int = self._count_valid_points(x=1001, y=1001, workers=workers)
+
+        print(f"Part 03: {tlt}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,19 @@
-import re
+from collections import Counter
+from typing import Sequence
+
+from src.python.common.cache import cached_parse
+from src.python.common.integers import read_ints
+from src.python.common.streaming import distinct_sum, smallest_distinct
 
 
 class Solution:
     """Solution to the problem."""
 
-    def __init__(self, data: list[int]):
-        self.data: list[int] = data
+    def __init__(self, data: Sequence[int]):
+        self.data: Sequence[int] = data
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
@@ -17,49 +23,64 @@ class Solution:
         Returns:
             Solution: Class instance with loaded data.
         """
-        data: list[int] = []
-
-        with open(file, "r") as f:
-            data = list(map(int, re.findall(r"(\d+)", f.read())))
-
-        return cls(data=data)
+        return cls(data=read_ints(file=file))
 
     def part01(self) -> None:
         """Solve Part 01."""
-        tlt: int = sum(set(self.data))
+        tlt: int = distinct_sum(values=self.data)
 
         print(f"Part 01: {tlt}")
 
-    def part02(self) -> None:
-        """Solve Part 02."""
-        tlt: int = sum(sorted(list(set(self.data)))[:20])
+    def part02(self, k: int = 20) -> None:
+        """Solve Part 02.
+
+        Args:
+            k (int): Number of smallest distinct crates to pack. Default is `20`.
+        """
+        tlt: int = sum(smallest_distinct(values=self.data, k=k))
 
         print(f"Part 02: {tlt}")
 
-    def part03(self) -> None:
-        """Solve Part 03."""
-        box_sets: dict[int, set[int]] = {0: set()}
+    def _count_crate_sets(self) -> int:
+        """Determine the number of sets needed to pack every crate, with strictly decreasing sizes within a set.
+
+        Crates of the same size must go into different sets, while crates of different sizes can always share a set,
+        so the number of sets is the count of the most common size.
+
+        Returns:
+            int: Number of sets.
+        """
+        return max(Counter(self.data).values(), default=0)
+
+    def pack_crates(self) -> list[list[int]]:
+        """Assign every crate to a set, each holding strictly decreasing sizes. `part03(show_sets=True)` prints them.
+
+        The `n`-th crate of each size goes into set `n`, which is what placing the crates from largest to smallest into
+        the first set without that size results in.
 
-        for box in sorted(self.data, reverse=True):
-            indx: int = 0
+        Returns:
+            list[list[int]]: Sizes of the crates in each set, from largest to smallest.
+        """
+        counts: Counter[int] = Counter(self.data)
+        res: list[list[int]] = [[] for _ in range(max(counts.values(), default=0))]
 
-            if box not in box_sets[indx]:
-                box_sets[indx].add(box)
-                continue
+        for size in sorted(counts, reverse=True):
+            for box_set in res[: counts[size]]:
+                box_set.append(size)
 
-            while True:
-                if (indx + 1) in box_sets.keys():
-                    if box not in box_sets[indx + 1]:
-                        box_sets[indx + 1].add(box)
-                        break
+        return res
 
-                else:
-                    box_sets[indx + 1] = {box}
-                    break
+    def part03(self, show_sets: bool = False) -> None:
+        """Solve Part 03.
 
-                indx += 1
+        Args:
+            show_sets (bool): Whether to also print the crates of each set, from `pack_crates`. Default is FALSE.
+        """
+        print(f"Part 03: {self._count_crate_sets()}")
 
-        print(f"Part 03: {len(box_sets.keys())}")
+        if show_sets:
+            for i, box_set in enumerate(self.pack_crates(), start=1):
+                print(f"Set {i}: {', '.join(map(str, box_set))}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+from src.python.common.cache import cached_parse
+
+
 class Solution:
     """Solution to the problem."""
 
@@ -5,6 +8,7 @@ class Solution:
         self.data: list[list[int]] = data
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
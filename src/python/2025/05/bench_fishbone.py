@@ -0,0 +1,99 @@
+import argparse
+import importlib
+import random
+import time
+
+from src.timing import Timing
+
+day05 = importlib.import_module("src.python.2025.05.day05")
+
+PARSER = argparse.ArgumentParser(
+    description="Check and time the 2025/05 fishbone construction on long random spines."
+)
+
+PARSER.add_argument(
+    "-b",
+    "--bones",
+    help="Numbers of bones per spine to time.",
+    type=int,
+    nargs="+",
+    default=[10000, 20000, 40000],
+)
+PARSER.add_argument(
+    "-s", "--swords", help="Number of swords to rank per size.", type=int, default=20
+)
+PARSER.add_argument("--seed", help="Random seed.", type=int, default=0)
+
+
+def first_fit_levels(bones: list[int]) -> list[list[int]]:
+    """Construct a fishbone by probing every level from the top, as a reference for the indexed construction.
+
+    Args:
+        bones (list[int]): Bones of the sword, in order.
+
+    Returns:
+        list[list[int]]: Left, center and right bone of each level, with `EMPTY` for free sides.
+    """
+    res: list[list[int]] = []
+
+    for bone in bones:
+        for level in res:
+            if bone < level[1] and level[0] == day05.EMPTY:
+                level[0] = bone
+                break
+
+            if bone > level[1] and level[2] == day05.EMPTY:
+                level[2] = bone
+                break
+
+        else:
+            res.append([day05.EMPTY, bone, day05.EMPTY])
+
+    return res
+
+
+def main() -> None:
+    """Entry point."""
+    args = PARSER.parse_args()
+    rng: random.Random = random.Random(args.seed)
+
+    for high in (9, 10**6):
+        # the reference is quadratic, so it is only run on a short spine
+        bones: list[int] = [rng.randint(1, high) for _ in range(2000)]
+        sword = day05.FishboneInstructions(id_=0, bones=bones)
+        sword.determine_fishbone_sword_score()
+
+        if [list(level) for level in zip(sword.left, sword.center, sword.right)] != (
+            first_fit_levels(bones=bones)
+        ):
+            raise ValueError(
+                f"Indexed construction differs from first fit (bones up to {high})."
+            )
+
+        for count in args.bones:
+            solution = day05.Solution(
+                data=[
+                    day05.FishboneInstructions(
+                        id_=i, bones=[rng.randint(1, high) for _ in range(count)]
+                    )
+                    for i in range(1, args.swords + 1)
+                ]
+            )
+
+            start: float = time.perf_counter()
+            records = solution.build_swords()
+            qualities: list[str] = [quality for _, quality, _ in records]
+            spread: str = day05.quality_difference(
+                high=max(qualities, key=day05.quality_key),
+                low=min(qualities, key=day05.quality_key),
+            )
+            elapsed: float = time.perf_counter() - start
+
+            print(
+                f"bones up to {high:<8} {count:>6} bones x {args.swords} swords: "
+                f"{Timing(elapsed).result()} ({len(spread)}-digit spread)"
+            )
+
+
+if __name__ == "__main__":
+    main()
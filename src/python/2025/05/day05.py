@@ -1,59 +1,148 @@
+import decimal
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 
+from src.python.common.cache import cached_parse
+from src.python.common.parallel import WORKERS, chunk_count
 
-@dataclass
+# marks a free side of a level
+EMPTY: int = -1
+
+# below this many swords, starting worker processes costs more than it saves
+MIN_PARALLEL_SWORDS: int = 1000
+
+# (digit count of the quality, quality digits, level scores, id), ranking swords from worst to best
+SortKey = tuple[int, str, tuple[int, ...], int]
+
+# (id, quality digits, level scores) of a constructed sword; the level scores are empty when not requested
+SwordRecord = tuple[int, str, tuple[int, ...]]
+
+
+def quality_key(quality: str) -> tuple[int, str]:
+    """Get a key ordering qualities by their numeric value, without converting their digits to an `int`.
+
+    Long spines give qualities of thousands of digits, beyond what `int()` converts by default. Without leading zeros,
+    a quality with more digits is larger, and qualities with as many digits compare like their strings.
+
+    Args:
+        quality (str): Digits of the quality.
+
+    Returns:
+        tuple[int, str]: Key of the quality.
+    """
+    return len(quality), quality
+
+
+def quality_difference(high: str, low: str) -> str:
+    """Subtract two qualities given as digits, exactly and without the `int()` digit limit.
+
+    Args:
+        high (str): Digits of the larger quality.
+        low (str): Digits of the smaller quality.
+
+    Returns:
+        str: Digits of the difference.
+    """
+    with decimal.localcontext(prec=max(len(high), len(low)) + 1):
+        return str(decimal.Decimal(high) - decimal.Decimal(low))
+
+
+@dataclass(slots=True)
 class FishboneInstructions:
-    """Representation of the instructions for the construction of a fishbone."""
+    """Representation of the instructions for the construction of a fishbone.
+
+    The fishbone is stored as parallel arrays holding the left, center and right bone of each level.
+    """
 
     id_: int
     bones: list[int]
-    fishbone: dict[int, list[int]]
+    left: array = field(default_factory=lambda: array("i"))
+    center: array = field(default_factory=lambda: array("i"))
+    right: array = field(default_factory=lambda: array("i"))
     _determined_score: bool = field(default=False)
+    _sort_key: SortKey | None = field(default=None)
 
     def __lt__(self, other):
         return self.compare_swords(other=other)
 
+    @property
+    def sort_key(self) -> SortKey:
+        """Key ranking the sword by quality, then level scores, then id, computed once. Constructs the fishbone."""
+        if self._sort_key is None:
+            quality: str = self.determine_fishbone_sword_score()
+            self._sort_key = (
+                *quality_key(quality=quality),
+                tuple(self.compute_level_scores().values()),
+                self.id_,
+            )
+
+        return self._sort_key
+
     def __repr__(self):
         return f"id={self.id_}"
 
-    def get_sword_score(self) -> int:
-        return int(
-            "".join(str(x) if x != -1 else "" for _, x, _ in self.fishbone.values())
-        )
+    def get_sword_score(self) -> str:
+        """Get the quality of the sword as its digits, as long spines exceed the digit limit of `int()`."""
+        return "".join(map(str, self.center))
 
-    def determine_fishbone_sword_score(self) -> int:
+    def determine_fishbone_sword_score(self) -> str:
         """Construct the fishbone to make the sword, returning the score of the constructed sword.
 
+        Every bone goes to the first level with a fitting free side. A segment tree over the levels keeps the largest
+        center among the levels with a free left side, and the smallest center among those with a free right side, so
+        that level is found in O(log levels) instead of probing the levels one by one.
+
         Returns:
-            int: Score of the constructed fishbone sword.
+            str: Digits of the score of the constructed fishbone sword.
         """
         if self._determined_score:
             return self.get_sword_score()
 
-        self.fishbone[0][1] = self.bones[0]
+        left: array = self.left
+        center: array = self.center
+        right: array = self.right
 
-        for bone in self.bones[1:]:
-            indx: int = 0
+        # a level is added for at most every bone
+        size: int = 1
+        while size < len(self.bones):
+            size *= 2
 
-            while True:
-                a, b, c = self.fishbone[indx]
+        # per node: largest center with a free left side, and smallest center with a free right side, below it
+        free_left: list[float] = [float("-inf")] * (2 * size)
+        free_right: list[float] = [float("inf")] * (2 * size)
 
-                if a == -1 and bone < b:
-                    self.fishbone[indx][0] = bone
-                    break
+        for bone in self.bones:
+            if free_left[1] > bone or free_right[1] < bone:
+                # descend to the first level that fits, preferring the left (shallower) child
+                node: int = 1
+                while node < size:
+                    node *= 2
+                    if not (free_left[node] > bone or free_right[node] < bone):
+                        node += 1
 
-                elif c == -1 and bone > b:
-                    self.fishbone[indx][-1] = bone
-                    break
+                level: int = node - size
 
-                else:
-                    # check for a next row
-                    if indx + 1 in self.fishbone.keys():
-                        indx += 1
+                if bone < center[level]:
+                    left[level] = bone
+                    free_left[node] = float("-inf")
 
-                    else:
-                        self.fishbone[indx + 1] = [-1, bone, -1]
-                        break
+                else:
+                    right[level] = bone
+                    free_right[node] = float("inf")
+
+            else:
+                node = size + len(center)
+                left.append(EMPTY)
+                center.append(bone)
+                right.append(EMPTY)
+                free_left[node] = free_right[node] = bone
+
+            node //= 2
+            while node:
+                free_left[node] = max(free_left[2 * node], free_left[2 * node + 1])
+                free_right[node] = min(free_right[2 * node], free_right[2 * node + 1])
+                node //= 2
 
         self._determined_score = True
         return self.get_sword_score()
@@ -65,8 +154,8 @@ class FishboneInstructions:
             dict[int, int]: Scores for each level of the fishbone sword.
         """
         return {
-            k + 1: int("".join(str(x) if x != -1 else "" for x in v))
-            for k, v in self.fishbone.items()
+            k + 1: int("".join(str(x) for x in level if x != EMPTY))
+            for k, level in enumerate(zip(self.left, self.center, self.right))
         }
 
     def compare_swords(self, other: "FishboneInstructions") -> bool:
@@ -78,17 +167,27 @@ class FishboneInstructions:
         Returns:
             bool: Which fishbone sword is better.
         """
-        if self.get_sword_score() != other.get_sword_score():
-            return other.get_sword_score() <= self.get_sword_score()
+        return other.sort_key < self.sort_key
 
-        # comparing levels
-        for f1, f2 in zip(
-            self.compute_level_scores().values(), other.compute_level_scores().values()
-        ):
-            if f1 != f2:
-                return f2 < f1
 
-        return other.id_ < self.id_
+def build_sword_record(id_: int, bones: list[int], levels: bool = True) -> SwordRecord:
+    """Construct a sword, keeping only its id, quality and level scores, for use in a worker process.
+
+    Args:
+        id_ (int): Id of the sword.
+        bones (list[int]): Bones of the sword, in order.
+        levels (bool): Whether to determine the level scores. Default is TRUE.
+
+    Returns:
+        SwordRecord: Id, quality and level scores of the sword.
+    """
+    sword: FishboneInstructions = FishboneInstructions(id_=id_, bones=bones)
+
+    if not levels:
+        return id_, sword.determine_fishbone_sword_score(), ()
+
+    _, quality, level_scores, _ = sword.sort_key
+    return id_, quality, level_scores
 
 
 class Solution:
@@ -98,6 +197,7 @@ class Solution:
         self.data: list[FishboneInstructions] = data
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
@@ -116,35 +216,82 @@ class Solution:
                     FishboneInstructions(
                         id_=int(p1),
                         bones=list(map(int, p2.strip().split(","))),
-                        fishbone={0: [-1, -1, -1]},
                     )
                 )
 
         return cls(data=data)
 
+    def build_swords(self, workers: int = 1, levels: bool = True) -> list[SwordRecord]:
+        """Construct every sword, in chunks over a process pool when there are enough of them.
+
+        Only the compact records are sent back from the workers, not the constructed fishbones.
+
+        Args:
+            workers (int): Number of processes. Default is `1`.
+            levels (bool): Whether to determine the level scores, which only ranking needs. Default is TRUE.
+
+        Returns:
+            list[SwordRecord]: Id, quality and level scores of each sword, in input order.
+        """
+        if workers <= 1 or len(self.data) < MIN_PARALLEL_SWORDS:
+            if not levels:
+                return [
+                    (sword.id_, sword.determine_fishbone_sword_score(), ())
+                    for sword in self.data
+                ]
+
+            return [(sword.id_, *sword.sort_key[1:3]) for sword in self.data]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    build_sword_record,
+                    [sword.id_ for sword in self.data],
+                    [sword.bones for sword in self.data],
+                    [levels] * len(self.data),
+                    chunksize=len(self.data)
+                    // chunk_count(items=len(self.data), workers=workers),
+                )
+            )
+
     def part01(self) -> None:
         """Solve Part 01."""
-        tlt: int = self.data[0].determine_fishbone_sword_score()
+        tlt: str = self.data[0].determine_fishbone_sword_score()
 
         print(f"Part 01: {tlt}")
 
-    def part02(self) -> None:
-        """Solve Part 02."""
-        sword_scores: list[int] = [
-            x.determine_fishbone_sword_score() for x in self.data
+    def part02(self, workers: int = WORKERS) -> None:
+        """Solve Part 02.
+
+        Args:
+            workers (int): Number of processes to build the swords with. Default is `EC_WORKERS`, else `1`.
+        """
+        sword_scores: list[str] = [
+            quality
+            for _, quality, _ in self.build_swords(workers=workers, levels=False)
         ]
-        tlt: int = max(sword_scores) - min(sword_scores)
+        tlt: str = quality_difference(
+            high=max(sword_scores, key=quality_key),
+            low=min(sword_scores, key=quality_key),
+        )
 
         print(f"Part 02: {tlt}")
 
-    def part03(self) -> None:
-        """Solve Part 03."""
-        for sword in self.data:
-            sword.determine_fishbone_sword_score()
+    def part03(self, workers: int = WORKERS) -> None:
+        """Solve Part 03.
 
-        self.data.sort()
+        Args:
+            workers (int): Number of processes to build the swords with. Default is `EC_WORKERS`, else `1`.
+        """
+        records: list[SwordRecord] = self.build_swords(workers=workers)
+
+        # best first: by quality, then level scores, then id
+        records.sort(
+            key=lambda record: (*quality_key(quality=record[1]), record[2], record[0]),
+            reverse=True,
+        )
 
-        tlt: int = sum(x.id_ * i for i, x in enumerate(self.data, 1))
+        tlt: int = sum(id_ * i for i, (id_, _, _) in enumerate(records, 1))
         print(f"Part 03: {tlt}")
 
 
@@ -1,10 +1,16 @@
+import itertools
+
+from src.python.common.cache import cached_parse
+
+
 class Solution:
     """Solution to the problem."""
 
-    def __init__(self, data: list[str]):
-        self.data: list[str] = data
+    def __init__(self, data: bytes):
+        self.data: bytes = data
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
@@ -14,10 +20,10 @@ class Solution:
         Returns:
             Solution: Class instance with loaded data.
         """
-        data: list[str] = []
+        data: bytes = b""
 
-        with open(file, "r") as f:
-            data = list(f.read().strip())
+        with open(file, "rb") as f:
+            data = f.read().strip()
 
         return cls(data=data)
 
@@ -31,19 +37,106 @@ class Solution:
             int: number of mentors available for the novices.
         """
         tlt: int = 0
+        novice_code: int = ord(novice)
+        mentor_code: int = ord(mentor)
 
         seen: int = 0
         for char in self.data:
-            if char == mentor:
+            if char == mentor_code:
                 seen += 1
                 continue
 
-            if char == novice:
+            if char == novice_code:
                 tlt += seen
                 continue
 
         return tlt
 
+    def count_mentor_novice_pairs(self) -> dict[str, int]:
+        """Determine the number of mentors available for the novices of every letter in a single pass.
+
+        Returns:
+            dict[str, int]: Number of mentors available for the novices of each letter in the data.
+        """
+        mentors: list[int] = [0] * 26
+        pairs: list[int] = [0] * 26
+        seen: list[bool] = [False] * 26
+        upper_a: int = ord("A")
+        lower_a: int = ord("a")
+
+        for char in self.data:
+            # bytes other than ASCII letters are neither mentors nor novices
+            if upper_a <= char <= ord("Z"):
+                mentors[char - upper_a] += 1
+                seen[char - upper_a] = True
+
+            elif lower_a <= char <= ord("z"):
+                pairs[char - lower_a] += mentors[char - lower_a]
+                seen[char - lower_a] = True
+
+        return {chr(lower_a + i): pairs[i] for i in range(26) if seen[i]}
+
+    def determine_number_mentors_novice_pairs_periodic(
+        self, novice: str, mentor: str, repeats: int, look_distance: int
+    ) -> int:
+        """Determine the number of mentors within `look_distance` of each novice, with the data repeated `repeats` times.
+
+        A mentor's window spans the same novices in every copy of the data where it is not cut by either end of the
+        sequence, so those copies are counted at once. Only the copies within `look_distance` of either end are
+        counted one by one, giving O(n + look_distance) work without building the repeated sequence.
+
+        Args:
+            novice (str): Novice to check for.
+            mentor (str): Mentor to check for.
+            repeats (int): Number of times the data is repeated.
+            look_distance (int): Maximum distance between a mentor and a novice.
+
+        Returns:
+            int: Number of mentor-novice pairs within range.
+        """
+        lngth: int = len(self.data)
+        end: int = lngth * repeats
+
+        # novices before each position of a single copy
+        novice_code: int = ord(novice)
+        mentor_code: int = ord(mentor)
+
+        prefix: list[int] = [0]
+        for char in self.data:
+            prefix.append(prefix[-1] + (char == novice_code))
+
+        def novices_before(position: int) -> int:
+            """Number of novices before `position` in the endlessly repeated data, also for negative positions."""
+            copies, offset = divmod(position, lngth)
+            return copies * prefix[-1] + prefix[offset]
+
+        tlt: int = 0
+
+        for j, char in enumerate(self.data):
+            if char != mentor_code:
+                continue
+
+            # copies where the window [position - look_distance, position + look_distance] is not cut
+            first: int = max(-((j - look_distance) // lngth), 0)
+            last: int = min((end - 1 - j - look_distance) // lngth, repeats - 1)
+
+            if first <= last:
+                tlt += (last - first + 1) * (
+                    novices_before(j + look_distance + 1)
+                    - novices_before(j - look_distance)
+                )
+
+            head_end: int = min(first, repeats)
+            for copy in itertools.chain(
+                range(head_end), range(max(last + 1, head_end), repeats)
+            ):
+                position: int = copy * lngth + j
+                tlt += novices_before(
+                    min(position + look_distance + 1, end)
+                ) - novices_before(max(position - look_distance, 0))
+
+        return tlt
+
     def part01(self) -> None:
         """Solve Part 01."""
         tlt: int = self.determine_number_mentors_novice_pairs(novice="a", mentor="A")
@@ -52,35 +145,26 @@ class Solution:
 
     def part02(self) -> None:
         """Solve Part 02."""
-        tlt: int = 0
-
-        for char in set([x.lower() for x in self.data]):
-            tlt += self.determine_number_mentors_novice_pairs(
-                novice=char.lower(), mentor=char.upper()
-            )
+        tlt: int = sum(self.count_mentor_novice_pairs().values())
 
         print(f"Part 02: {tlt}")
 
-    def part03(self) -> None:
-        """Solve Part 03. A very slow implementation."""
-        tlt: int = 0
+    def part03(self, repeats: int = 1000, look_distance: int = 1000) -> None:
+        """Solve Part 03.
 
-        look_distance: int = 1000
-        repeats: int = 1000
-        lngth: int = len(self.data)
+        Args:
+            repeats (int): Number of times the data is repeated. Default is `1000`.
+            look_distance (int): Maximum distance between a mentor and a novice. Default is `1000`.
+        """
+        tlt: int = 0
 
-        if look_distance >= lngth * repeats:
-            for ltr in ("a", "b", "c"):
-                novices: list[int] = [int(c == ltr) for c in self.data] * repeats
-                mentors: list[int] = [
-                    int(c == ltr.upper()) for c in self.data
-                ] * repeats
-
-                for i, mentor in enumerate(mentors):
-                    if mentor == 1:
-                        lowerbound: int = max(0, i - look_distance)
-                        upperbound: int = min(i + 1 + look_distance, len(novices))
-                        tlt += sum(novices[lowerbound:upperbound])
+        for char in {chr(x) for x in self.data.lower() if ord("a") <= x <= ord("z")}:
+            tlt += self.determine_number_mentors_novice_pairs_periodic(
+                novice=char.lower(),
+                mentor=char.upper(),
+                repeats=repeats,
+                look_distance=look_distance,
+            )
 
         print(f"Part 03: {tlt}")
 
@@ -1,5 +1,7 @@
 from collections import deque
 
+from src.python.common.cache import cached_parse
+
 
 class Solution:
     """Solution to the problem."""
@@ -8,7 +10,11 @@ class Solution:
         self.names: list[str] = names
         self.rules: dict[str, list[str]] = rules
 
+        # memoised number of ways to append a number of letters after a letter, by (letter, remaining length)
+        self._ways: dict[tuple[str, int], int] = {}
+
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
@@ -83,6 +89,88 @@ class Solution:
 
         return res
 
+    def count_ways(self, letter: str, remaining: int) -> int:
+        """Determine the number of distinct ways to append exactly `remaining` letters after `letter`.
+
+        Args:
+            letter (str): Last letter of the name so far.
+            remaining (int): Number of letters to append.
+
+        Returns:
+            int: Number of distinct continuations.
+        """
+        if remaining == 0:
+            return 1
+
+        key: tuple[str, int] = (letter, remaining)
+
+        if key not in self._ways:
+            self._ways[key] = sum(
+                self.count_ways(letter=next_ltr, remaining=remaining - 1)
+                for next_ltr in set(self.rules.get(letter, ()))
+            )
+
+        return self._ways[key]
+
+    def count_potential_names_with_prefix(
+        self, prefix: str, min_length: int, max_length: int
+    ) -> int:
+        """Count the potential names that can be formed with the given `prefix` and within the target length.
+
+        This matches the size of `determine_potential_names_with_prefix` without building any name.
+
+        Args:
+            prefix (str): Prefix of the name.
+            min_length (int): Minimum length of the name.
+            max_length (int): Maximum length of the name.
+
+        Returns:
+            int: Number of potential names.
+        """
+        if not self.is_valid_prefix(prefix=prefix):
+            return 0
+
+        return sum(
+            self.count_ways(letter=prefix[-1], remaining=length - len(prefix))
+            for length in range(max(min_length, len(prefix)), max_length + 1)
+        )
+
+    def determine_independent_prefixes(self) -> list[str]:
+        """Determine the valid names that do not extend another valid name.
+
+        Every potential name of a name extending a shorter valid name is also a potential name of that shorter name, so
+        only the shortest ones matter, and no two of them share a potential name. The names are put into a trie, which
+        is then walked down to the first name on each branch.
+
+        Returns:
+            list[str]: Valid names that do not extend another valid name, in lexicographic order.
+        """
+        # each node maps the next letters to their nodes, with the `None` key marking the end of a name
+        trie: dict = {}
+
+        for name in self.names:
+            if not self.is_valid_prefix(prefix=name):
+                continue
+
+            node: dict = trie
+            for ltr in name:
+                node = node.setdefault(ltr, {})
+            node[None] = name
+
+        res: list[str] = []
+        stack: list[dict] = [trie]
+
+        while stack:
+            node = stack.pop()
+
+            if None in node:
+                res.append(node[None])
+                continue
+
+            stack.extend(node[ltr] for ltr in sorted(node, reverse=True))
+
+        return res
+
     def part01(self) -> None:
         """Solve Part 01."""
         determined_name: str = "-"
@@ -102,15 +190,14 @@ class Solution:
 
     def part03(self) -> None:
         """Solve Part 03."""
-        all_names: set[str] = set()
-        for name in self.names:
-            all_names.update(
-                self.determine_potential_names_with_prefix(
-                    prefix=name, min_length=7, max_length=11
-                )
+        tlt: int = sum(
+            self.count_potential_names_with_prefix(
+                prefix=prefix, min_length=7, max_length=11
             )
+            for prefix in self.determine_independent_prefixes()
+        )
 
-        print(f"Part 03: {len(all_names)}")
+        print(f"Part 03: {tlt}")
 
 
 if __name__ == "__main__":
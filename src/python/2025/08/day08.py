@@ -2,6 +2,8 @@ import math
 from dataclasses import dataclass
 from itertools import pairwise
 
+from src.python.common.cache import cached_parse
+
 
 @dataclass
 class Point:
@@ -148,6 +150,7 @@ class Solution:
         self.data: list[int] = data
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from itertools import combinations
 from math import prod
 
+from src.python.common.cache import cached_parse
 from src.python.common.dsu import UnionFind
 
 
@@ -59,6 +60,7 @@ class Solution:
         self.data: dict[int, DNA] = {dna.id_: dna for dna in data}
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
@@ -150,20 +152,22 @@ class Solution:
             self.determine_parent_children_relationships()
         )
 
-        dsu: UnionFind = UnionFind()
+        dsu: UnionFind[int] = UnionFind()
 
-        for (parent1_id, parent2_id), children in relationships.items():
-            dsu.union(x=parent1_id, y=parent2_id)
-
-            for child_id in children:
-                dsu.union(x=parent1_id, y=child_id)
+        # every duck is a family of its own until merged, even without any relationship, added in data order
+        for duck_id in self.data:
+            dsu.find(x=duck_id)
 
-        # group ducks
-        families: dict[int, set[int]] = defaultdict(set)
-        for duck_id in self.data.keys():
-            families[dsu.find(x=duck_id)].add(duck_id)
+        dsu.union_many(
+            edges=(
+                (parent1_id, member_id)
+                for (parent1_id, parent2_id), children in relationships.items()
+                for member_id in (parent2_id, *children)
+            )
+        )
 
-        tlt: int = sum(max(families.values(), key=len))
+        # the families are tracked while merging, so no regrouping is needed; ties go to the first family in data order
+        tlt: int = sum(dsu.members(root=dsu.largest()))
         print(f"Part 03: {tlt}")
 
 
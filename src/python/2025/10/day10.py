@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from src.python.common.cache import cached_parse
+
 
 class SheepStateEnum(Enum):
     ALIVE = 1
@@ -262,6 +264,7 @@ class Solution:
         self.board: DragonBoard = DragonBoard(board=data)
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
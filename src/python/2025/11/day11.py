@@ -1,3 +1,6 @@
+from src.python.common.cache import cached_parse
+
+
 class DuckFormation:
     """Representation of the Duck Formation for the problem."""
 
@@ -109,6 +112,7 @@ class Solution:
         self.flock: DuckFormation = DuckFormation(initial_columns=data)
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
@@ -2,6 +2,8 @@ from collections import defaultdict, deque
 
 from cp_utils.grids import Grid
 
+from src.python.common.cache import cached_parse
+
 
 class Solution:
     """Solution to the problem."""
@@ -13,6 +15,7 @@ class Solution:
         self.grid: Grid[int] = data
 
     @classmethod
+    @cached_parse
     def parse(cls, file: str) -> "Solution":
         """Parse the given input file and return an instance of `Solution` with the loaded data.
 
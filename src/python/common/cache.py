@@ -0,0 +1,195 @@
+import functools
+import hashlib
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+import types
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+CACHE_DIR: Path = Path(os.environ.get("EC_PARSE_CACHE_DIR", "./.cache/parse"))
+CACHE_MAX_BYTES: int = int(os.environ.get("EC_PARSE_CACHE_MAX_BYTES", 256 * 1024**2))
+CACHE_ENABLED: bool = os.environ.get("EC_PARSE_CACHE", "1") != "0"
+
+
+def _record_arguments(
+    *args: Any, **kwargs: Any
+) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """Stand-in for the class passed to `parse`, returning the constructor arguments instead of an instance."""
+    return args, kwargs
+
+
+@functools.cache
+def _module_digest(name: str) -> bytes:
+    """Hash the source of a module together with the source of the modules it uses.
+
+    Every global of the module that is a module, or that was defined in one, is followed. Modules of the same
+    top-level package, such as the shared helpers under `src.python.common`, are followed recursively. Third-party
+    modules only add their own file, and the standard library is skipped.
+
+    Args:
+        name (str): Name of the module, which must already be imported.
+
+    Returns:
+        bytes: Digest of the sources.
+    """
+    package: str = name.partition(".")[0]
+    files: dict[str, str] = {}
+    pending: list[str] = [name]
+
+    while pending:
+        current: str = pending.pop()
+        module: types.ModuleType | None = sys.modules.get(current)
+
+        if current in files or module is None:
+            continue
+
+        files[current] = getattr(module, "__file__", None) or ""
+
+        if current.partition(".")[0] != package:
+            continue
+
+        for value in vars(module).values():
+            dependency: object = (
+                value.__name__
+                if isinstance(value, types.ModuleType)
+                else getattr(value, "__module__", None)
+            )
+
+            if isinstance(dependency, str) and (
+                dependency.partition(".")[0] not in sys.stdlib_module_names
+                and dependency != "builtins"
+            ):
+                pending.append(dependency)
+
+    digest = hashlib.sha256()
+
+    for module_name, file in sorted(files.items()):
+        digest.update(module_name.encode())
+
+        try:
+            with open(file, "rb") as f:
+                digest.update(hashlib.file_digest(f, "sha256").digest())
+
+        except OSError:
+            # built-in or namespace modules have no source to hash
+            pass
+
+    return digest.digest()
+
+
+def _cache_key(cls: type, func: Callable[..., Any], file: str) -> str:
+    """Determine the cache key of parsing `file` with `func` for `cls`.
+
+    The class, the code of the parse function and the source of the modules the class depends on are part of the key,
+    so editing a parser or a helper it calls, or loading the same module under a different name, never serves stale or
+    unpicklable entries.
+
+    Args:
+        cls (type): Class being parsed into.
+        func (Callable[..., Any]): Undecorated parse function.
+        file (str): Input file to parse.
+
+    Returns:
+        str: Hex digest identifying the parsed result.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+    digest.update(marshal.dumps(func.__code__))
+    digest.update(_module_digest(name=cls.__module__))
+
+    with open(file, "rb") as f:
+        digest.update(hashlib.file_digest(f, "sha256").digest())
+
+    return digest.hexdigest()
+
+
+def _evict(directory: Path, max_bytes: int) -> None:
+    """Remove the least recently used entries until the cache fits within `max_bytes`.
+
+    Args:
+        directory (Path): Cache directory.
+        max_bytes (int): Maximum total size of the cache.
+    """
+    entries: list[tuple[float, int, Path]] = []
+
+    for path in directory.glob("*.pickle"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total: int = sum(size for _, size, _ in entries)
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def cached_parse(func: Callable[[type[T], str], T]) -> Callable[[type[T], str], T]:
+    """Cache the constructor arguments produced by a `Solution.parse` function, keyed by the contents of the input file.
+
+    The parse function is run with a stand-in for `cls` that records the arguments it is constructed with. These are
+    pickled under `EC_PARSE_CACHE_DIR`, and later calls with the same input build the instance straight from them. The
+    cache is bounded to `EC_PARSE_CACHE_MAX_BYTES`, evicting the least recently used entries, and can be disabled by
+    setting `EC_PARSE_CACHE=0`. Apply it below `@classmethod`.
+
+    Args:
+        func (Callable[[type[T], str], T]): Parse function, constructing `cls` with the parsed data.
+
+    Returns:
+        Callable[[type[T], str], T]: Caching parse function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(cls: type[T], file: str) -> T:
+        if not CACHE_ENABLED:
+            return func(cls, file)
+
+        path: Path = CACHE_DIR / f"{_cache_key(cls=cls, func=func, file=file)}.pickle"
+
+        try:
+            with open(path, "rb") as f:
+                args, kwargs = pickle.load(f)
+
+            os.utime(path)
+            return cls(*args, **kwargs)
+
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass
+
+        args, kwargs = func(_record_arguments, file)  # type: ignore[arg-type]
+
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(
+                dir=CACHE_DIR, suffix=".tmp", delete=False
+            ) as f:
+                try:
+                    pickle.dump((args, kwargs), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    # caching is best effort; the parsed data is still returned
+                    f.close()
+                    os.unlink(f.name)
+                    return cls(*args, **kwargs)
+
+            os.replace(f.name, path)
+            _evict(directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES)
+
+        except OSError:
+            pass
+
+        return cls(*args, **kwargs)
+
+    return wrapper
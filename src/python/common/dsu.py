@@ -1,23 +1,55 @@
-from collections import defaultdict
-from typing import Generic, TypeVar
+from array import array
+from typing import Any, Generic, Iterable, TypeVar
 
 T = TypeVar("T")
 
 
 class UnionFind(Generic[T]):
-    """Union Find (Disjoint Set Union) data structure implementation."""
+    """Union Find (Disjoint Set Union) data structure implementation.
+
+    The members and size of every set are kept up to date during `union`, merging the smaller set into the larger one,
+    so the components never have to be rebuilt from scratch.
+    """
 
     def __init__(self, data: dict[T, T] | None = None):
         self.parent: dict[T, T] = {}
-        self.rank: dict[T, int] = defaultdict(int)
+        self.size: dict[T, int] = {}
+        self._members: dict[T, list[T]] = {}
+        # insertion index of the first added member of each set, breaking ties between sets of the same size
+        self._first: dict[T, int] = {}
+        self._largest: T | None = None
 
         if data is not None:
             self._parse(data=data)
 
+    @classmethod
+    def from_edges(cls, src: Iterable[T], dst: Iterable[T]) -> "UnionFind[T]":
+        """Build a Union Find from two parallel sequences of edge endpoints, such as NumPy arrays.
+
+        Args:
+            src (Iterable[T]): First endpoint of each edge.
+            dst (Iterable[T]): Second endpoint of each edge.
+
+        Returns:
+            UnionFind[T]: Union Find with all edges merged.
+        """
+        res: UnionFind[T] = cls()
+        res.union_many(edges=zip(_as_list(src), _as_list(dst)))
+        return res
+
     def _parse(self, data: dict[T, T]) -> None:
         """Parse the given data."""
-        for k, v in data.items():
-            self.union(x=k, y=v)
+        self.union_many(edges=data.items())
+
+    def _add(self, x: T) -> None:
+        """Add `x` as a new singleton set."""
+        self._first[x] = len(self.parent)
+        self.parent[x] = x
+        self.size[x] = 1
+        self._members[x] = [x]
+
+        if self._largest is None:
+            self._largest = x
 
     def find(self, x: T) -> T:
         """Find the root representative of the set containing `x`.
@@ -29,7 +61,7 @@ class UnionFind(Generic[T]):
             T: The found root representative.
         """
         if x not in self.parent:
-            self.parent[x] = x
+            self._add(x=x)
 
         if self.parent[x] != x:
             self.parent[x] = self.find(self.parent[x])
@@ -51,31 +83,78 @@ class UnionFind(Generic[T]):
         if root_x == root_y:
             return False
 
-        if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
 
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size.pop(root_y)
+        self._members[root_x].extend(self._members.pop(root_y))
+        self._first[root_x] = min(self._first[root_x], self._first.pop(root_y))
 
-        else:
-            self.parent[root_y] = root_x
-            self.rank[root_x] += 1
+        # sets only grow, so the merged set is the only one that can overtake the largest
+        largest: T | None = self._largest
+        if (
+            largest is None
+            or largest == root_y
+            or self.size[root_x] > self.size[largest]
+            or (
+                self.size[root_x] == self.size[largest]
+                and self._first[root_x] < self._first[largest]
+            )
+        ):
+            self._largest = root_x
 
         return True
 
+    def union_many(self, edges: Iterable[tuple[T, T]]) -> int:
+        """Merge the sets of both elements of every edge.
+
+        Args:
+            edges (Iterable[tuple[T, T]]): Pairs of elements to merge, e.g. a list of pairs or an `(m, 2)` NumPy array.
+
+        Returns:
+            int: Number of merges performed.
+        """
+        union = self.union
+        return sum(union(x, y) for x, y in _as_list(edges))
+
+    def members(self, root: T) -> list[T]:
+        """Get the members of the set with the given root. Use `find` to get the root of any element.
+
+        Args:
+            root (T): Root representative of the set.
+
+        Returns:
+            list[T]: All elements of the set. This is the live list, and should not be modified.
+        """
+        return self._members[root]
+
+    def sizes(self) -> dict[T, int]:
+        """Get the sizes of all the sets.
+
+        Returns:
+            dict[T, int]: Dictionary mapping of each root element to the size of its set.
+        """
+        return dict(self.size)
+
+    def largest(self) -> T:
+        """Get the root of the largest set. Ties are won by the set whose first member was added first.
+
+        Returns:
+            T: Root representative of the largest set.
+        """
+        if self._largest is None:
+            raise ValueError("No elements have been added to the Union Find.")
+
+        return self._largest
+
     def get_components(self) -> dict[T, set[T]]:
         """Get all the connected components.
 
         Returns:
             dict[T, set[T]]: Dictionary mapping of each root element to a set of all its components.
         """
-        components: dict[T, set[T]] = defaultdict(set)
-
-        for element in self.parent.keys():
-            root: T = self.find(x=element)
-            components[root].add(element)
-
-        return components
+        return {root: set(members) for root, members in self._members.items()}
 
     def get_sets(self) -> dict[T, set[T]]:
         """Get all the constructed sets.
@@ -91,7 +170,7 @@ class UnionFind(Generic[T]):
         Returns:
             dict[T, int]: Dictionary mapping of each element to the size of its components.
         """
-        return {root: len(members) for root, members in self.get_components().items()}
+        return self.sizes()
 
     def get_set_sizes(self) -> dict[T, int]:
         """Get all the sizes of the set.
@@ -100,3 +179,290 @@ class UnionFind(Generic[T]):
             dict[T, int]: Dictionary mapping of each element to the size of its sets.
         """
         return self.get_component_sizes()
+
+
+def _as_list(values: Iterable[Any]) -> Iterable[Any]:
+    """Convert NumPy arrays into lists of plain Python values, leaving other iterables as is."""
+    tolist = getattr(values, "tolist", None)
+    return tolist() if tolist is not None else values
+
+
+def connected_component_labels(n: int, src: Any, dst: Any) -> Any:
+    """Label the connected components of the graph over `[0, n)` with vectorised hooking and pointer jumping.
+
+    Each root is hooked onto the smallest root it shares an edge with, after which every label is jumped to its root,
+    until no edge joins two different roots. Requires NumPy.
+
+    Args:
+        n (int): Number of vertices.
+        src (Any): NumPy integer array of the first endpoint of each edge.
+        dst (Any): NumPy integer array of the second endpoint of each edge.
+
+    Returns:
+        Any: NumPy array with the smallest vertex of the component of each vertex.
+    """
+    import numpy as np
+
+    labels = np.arange(n, dtype=np.int64)
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+
+    while True:
+        label_src, label_dst = labels[src], labels[dst]
+        crossing = label_src != label_dst
+
+        if not crossing.any():
+            return labels
+
+        low = np.minimum(label_src[crossing], label_dst[crossing])
+        high = np.maximum(label_src[crossing], label_dst[crossing])
+        np.minimum.at(labels, high, low)
+
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+class IntUnionFind:
+    """Array backed Union Find over the integers `[0, n)`, using path halving and union by size."""
+
+    def __init__(self, n: int):
+        self.parent: array[int] = array("i", range(n))
+        self.size: array[int] = array("i", [1]) * n
+        self.num_components: int = n
+        self.largest_root: int = 0
+        self.largest_component: int = 1 if n else 0
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    @classmethod
+    def from_edges(
+        cls, n: int, src: Iterable[int], dst: Iterable[int]
+    ) -> "IntUnionFind":
+        """Build a Union Find over `[0, n)` from two parallel sequences of edge endpoints.
+
+        When both are NumPy arrays the components are found with `connected_component_labels` instead of a union per
+        edge, rooting every set at its smallest element.
+
+        Args:
+            n (int): Number of elements.
+            src (Iterable[int]): First endpoint of each edge.
+            dst (Iterable[int]): Second endpoint of each edge.
+
+        Returns:
+            IntUnionFind: Union Find with all edges merged.
+        """
+        res: IntUnionFind = cls(n=n)
+
+        if not (hasattr(src, "dtype") and hasattr(dst, "dtype")):
+            res.union_many(edges=zip(_as_list(src), _as_list(dst)))
+            return res
+
+        import numpy as np
+
+        labels = connected_component_labels(n=n, src=src, dst=dst)
+        sizes = np.bincount(labels, minlength=n)
+
+        res.parent = array("i", labels.astype(np.int32).tobytes())
+        res.size = array("i", sizes.astype(np.int32).tobytes())
+        res.num_components = int(np.count_nonzero(sizes))
+
+        if n:
+            res.largest_root = int(sizes.argmax())
+            res.largest_component = int(sizes[res.largest_root])
+
+        return res
+
+    def find(self, x: int) -> int:
+        """Find the root representative of the set containing `x`.
+
+        Args:
+            x (int): Element to find the root of.
+
+        Returns:
+            int: The found root representative.
+        """
+        parent: array[int] = self.parent
+
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge set containing `x` with set containing `y`.
+
+        Args:
+            x (int): First element.
+            y (int): Second element.
+
+        Returns:
+            bool: True if the elements were merged, else False.
+        """
+        root_x, root_y = self.find(x), self.find(y)
+
+        if root_x == root_y:
+            return False
+
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.num_components -= 1
+
+        if self.size[root_x] > self.largest_component:
+            self.largest_component = self.size[root_x]
+            self.largest_root = root_x
+
+        return True
+
+    def union_many(self, edges: Iterable[tuple[int, int]]) -> int:
+        """Merge the sets of both elements of every edge.
+
+        Args:
+            edges (Iterable[tuple[int, int]]): Pairs of elements to merge, e.g. a list of pairs or an `(m, 2)` NumPy
+                array.
+
+        Returns:
+            int: Number of merges performed.
+        """
+        union = self.union
+        return sum(union(x, y) for x, y in _as_list(edges))
+
+    def connected(self, x: int, y: int) -> bool:
+        """Whether `x` and `y` are in the same set."""
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        """Get the size of the set containing `x`.
+
+        Args:
+            x (int): Element of the set.
+
+        Returns:
+            int: Number of elements in the set.
+        """
+        return self.size[self.find(x)]
+
+
+class RollbackUnionFind:
+    """Union Find over the integers `[0, n)` that can undo its unions.
+
+    Path compression is skipped, so every `union` changes a single parent link. The change is pushed onto a history
+    stack, allowing `rollback` to a `snapshot` in O(changes) for offline and what-if queries.
+    """
+
+    def __init__(self, n: int):
+        self.parent: array[int] = array("i", range(n))
+        self.size: array[int] = array("i", [1]) * n
+        self.num_components: int = n
+        self.largest_root: int = 0
+        self.largest_component: int = 1 if n else 0
+        self.history: list[tuple[int, int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        """Find the root representative of the set containing `x`. Runs in O(log n) due to union by size.
+
+        Args:
+            x (int): Element to find the root of.
+
+        Returns:
+            int: The found root representative.
+        """
+        parent: array[int] = self.parent
+
+        while parent[x] != x:
+            x = parent[x]
+
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge set containing `x` with set containing `y`, recording the change.
+
+        Args:
+            x (int): First element.
+            y (int): Second element.
+
+        Returns:
+            bool: True if the elements were merged, else False.
+        """
+        root_x, root_y = self.find(x), self.find(y)
+
+        if root_x == root_y:
+            return False
+
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+
+        self.history.append((root_x, root_y, self.largest_root, self.largest_component))
+
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.num_components -= 1
+
+        if self.size[root_x] > self.largest_component:
+            self.largest_component = self.size[root_x]
+            self.largest_root = root_x
+
+        return True
+
+    def union_many(self, edges: Iterable[tuple[int, int]]) -> int:
+        """Merge the sets of both elements of every edge.
+
+        Args:
+            edges (Iterable[tuple[int, int]]): Pairs of elements to merge.
+
+        Returns:
+            int: Number of merges performed.
+        """
+        union = self.union
+        return sum(union(x, y) for x, y in _as_list(edges))
+
+    def connected(self, x: int, y: int) -> bool:
+        """Whether `x` and `y` are in the same set."""
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        """Get the size of the set containing `x`.
+
+        Args:
+            x (int): Element of the set.
+
+        Returns:
+            int: Number of elements in the set.
+        """
+        return self.size[self.find(x)]
+
+    def snapshot(self) -> int:
+        """Get a marker of the current state, to later `rollback` to.
+
+        Returns:
+            int: Marker of the current state.
+        """
+        return len(self.history)
+
+    def rollback(self, snapshot: int = 0) -> None:
+        """Undo all unions performed since the given snapshot.
+
+        Args:
+            snapshot (int): Marker returned by `snapshot`. Default is `0`, undoing every union.
+        """
+        if not 0 <= snapshot <= len(self.history):
+            raise ValueError(f"Invalid snapshot: {snapshot}.")
+
+        while len(self.history) > snapshot:
+            root_x, root_y, largest_root, largest_component = self.history.pop()
+
+            self.parent[root_y] = root_y
+            self.size[root_x] -= self.size[root_y]
+            self.num_components += 1
+            self.largest_root = largest_root
+            self.largest_component = largest_component
@@ -0,0 +1,85 @@
+import re
+from array import array
+from typing import Iterator
+
+CHUNK_SIZE: int = 1024**2
+
+_UNSIGNED: re.Pattern[bytes] = re.compile(rb"\d+")
+_SIGNED: re.Pattern[bytes] = re.compile(rb"-?\d+")
+_DIGITS: bytes = b"0123456789"
+
+
+def iter_int_chunks(
+    file: str, chunk_size: int = CHUNK_SIZE, signed: bool = False
+) -> Iterator[list[int]]:
+    """Read the integers of a file in fixed-size chunks, so that only a single chunk is held in memory at a time.
+
+    A number cut by the end of a chunk is carried over to the next one, so every number is yielded whole.
+
+    Args:
+        file (str): File to read.
+        chunk_size (int): Number of bytes to read at a time. Default is 1 MiB.
+        signed (bool): Whether a leading `-` is part of a number. Default is FALSE.
+
+    Yields:
+        list[int]: Integers found in each chunk, in file order.
+    """
+    pattern: re.Pattern[bytes] = _SIGNED if signed else _UNSIGNED
+    carry: bytes = b""
+
+    with open(file, "rb") as f:
+        while chunk := f.read(chunk_size):
+            chunk = carry + chunk
+
+            # a number, or a lone minus sign, at the end may continue in the next chunk
+            cut: int = len(chunk.rstrip(_DIGITS))
+            if chunk[cut - 1 : cut] == b"-":
+                cut -= 1
+
+            carry = chunk[cut:]
+            yield list(map(int, pattern.findall(chunk, 0, cut)))
+
+    if carry:
+        yield list(map(int, pattern.findall(carry)))
+
+
+def iter_ints(
+    file: str, chunk_size: int = CHUNK_SIZE, signed: bool = False
+) -> Iterator[int]:
+    """Read the integers of a file one by one, without loading the whole file.
+
+    Args:
+        file (str): File to read.
+        chunk_size (int): Number of bytes to read at a time. Default is 1 MiB.
+        signed (bool): Whether a leading `-` is part of a number. Default is FALSE.
+
+    Yields:
+        int: Each integer in the file.
+    """
+    for values in iter_int_chunks(file=file, chunk_size=chunk_size, signed=signed):
+        yield from values
+
+
+def read_ints(
+    file: str, chunk_size: int = CHUNK_SIZE, signed: bool = False, typecode: str = "q"
+) -> array:
+    """Read the integers of a file into a compact array, without loading the whole file.
+
+    The array takes 8 bytes per number with the default typecode, against about 36 for a list of `int` objects. It
+    supports the buffer protocol, so `numpy.frombuffer` wraps it as a NumPy array without copying.
+
+    Args:
+        file (str): File to read.
+        chunk_size (int): Number of bytes to read at a time. Default is 1 MiB.
+        signed (bool): Whether a leading `-` is part of a number. Default is FALSE.
+        typecode (str): Typecode of the array. Default is `q` (signed 64-bit).
+
+    Returns:
+        array: Integers of the file, in order.
+    """
+    res: array = array(typecode)
+
+    for values in iter_int_chunks(file=file, chunk_size=chunk_size, signed=signed):
+        res.extend(values)
+
+    return res
@@ -0,0 +1,20 @@
+import os
+
+# worker processes a part splits its work over; kept at 1 by default, as the runner already runs parts in parallel
+WORKERS: int = int(os.environ.get("EC_WORKERS", "1"))
+
+# chunks handed to each worker, so that chunks finishing early even out against chunks running long
+CHUNKS_PER_WORKER: int = 4
+
+
+def chunk_count(items: int, workers: int) -> int:
+    """Get the number of chunks to split work over a process pool in.
+
+    Args:
+        items (int): Number of independent items of work, e.g. grid rows or swords.
+        workers (int): Number of processes.
+
+    Returns:
+        int: Number of chunks, at least `1` and at most `items`.
+    """
+    return max(min(items, workers * CHUNKS_PER_WORKER), 1)
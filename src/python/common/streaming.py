@@ -0,0 +1,57 @@
+import heapq
+from typing import Iterable
+
+
+def distinct_sum(values: Iterable[int]) -> int:
+    """Sum the distinct values of a stream in a single pass.
+
+    Args:
+        values (Iterable[int]): Values to sum, e.g. `iter_ints(file)`.
+
+    Returns:
+        int: Sum of the distinct values.
+    """
+    seen: set[int] = set()
+    tlt: int = 0
+
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            tlt += value
+
+    return tlt
+
+
+def smallest_distinct(values: Iterable[int], k: int) -> list[int]:
+    """Find the `k` smallest distinct values of a stream in a single pass, holding at most `k` values.
+
+    A max-heap of the smallest values so far is kept, so each value costs at most O(log k) instead of sorting the
+    whole stream.
+
+    Args:
+        values (Iterable[int]): Values to search, e.g. `iter_ints(file)`.
+        k (int): Number of values to find.
+
+    Returns:
+        list[int]: The `k` smallest distinct values, or all of them if there are fewer, in ascending order.
+    """
+    if k <= 0:
+        return []
+
+    # values are negated, as `heapq` only provides a min-heap
+    heap: list[int] = []
+    kept: set[int] = set()
+
+    for value in values:
+        if value in kept:
+            continue
+
+        if len(heap) < k:
+            heapq.heappush(heap, -value)
+            kept.add(value)
+
+        elif value < -heap[0]:
+            kept.discard(-heapq.heapreplace(heap, -value))
+            kept.add(value)
+
+    return sorted(-value for value in heap)
@@ -0,0 +1,387 @@
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.memory import MemoryReport, track_memory
+from src.profiling import profile_call
+from src.timing import Timing
+
+PARSER = argparse.ArgumentParser(
+    description="Run every discovered quest part across a process pool."
+)
+
+PARSER.add_argument("-y", "--year", help="Year of the event to run.", default="2025")
+PARSER.add_argument(
+    "-d", "--days", help="Days to run, e.g. `1-12` or `1,3,5-7`. Default is all."
+)
+PARSER.add_argument(
+    "-p", "--parts", help="Parts to run, e.g. `1-3` or `3`.", default="1-3"
+)
+PARSER.add_argument(
+    "-j", "--jobs", help="Number of worker processes.", type=int, default=None
+)
+PARSER.add_argument(
+    "-i",
+    "--inputs",
+    help="Root folder of the input files.",
+    default="./inputs/everybody_codes",
+)
+PARSER.add_argument(
+    "-m",
+    "--memory",
+    help="Report the peak memory of each part. Each part then runs in a fresh process.",
+    action="store_true",
+    default=False,
+)
+PARSER.add_argument(
+    "--top",
+    help="Number of top allocation sites to report per part with `--memory`.",
+    type=int,
+    default=5,
+)
+PARSER.add_argument(
+    "--profile",
+    help="Run each part under cProfile, writing `.pstats` and collapsed-stack files.",
+    action="store_true",
+    default=False,
+)
+PARSER.add_argument(
+    "--profile-dir",
+    help="Folder to write the profiles to.",
+    default="./profiles",
+)
+
+SOLUTIONS_PATH: Path = Path(__file__).resolve().parent / "python"
+
+
+@dataclass(frozen=True)
+class Unit:
+    """A single runnable (year, day, part) of a quest."""
+
+    year: int
+    day: int
+    part: int
+
+    @property
+    def module_name(self) -> str:
+        """Import path of the module containing the quest solution."""
+        return f"src.python.{self.year}.{self.day:02d}.day{self.day:02d}"
+
+    @property
+    def method_name(self) -> str:
+        """Name of the `Solution` method solving the part."""
+        return f"part{self.part:02d}"
+
+    def input_path(self, inputs: str) -> Path:
+        """Path to the input file of the part.
+
+        Args:
+            inputs (str): Root folder of the input files.
+
+        Returns:
+            Path: Input file path for the part.
+        """
+        return (
+            Path(inputs)
+            / str(self.year)
+            / f"{self.day:02d}"
+            / f"input_p{self.part:02d}.txt"
+        )
+
+    def output_path(self, folder: str) -> Path:
+        """Path, without an extension, of the files written for the part.
+
+        Args:
+            folder (str): Root folder of the output files.
+
+        Returns:
+            Path: Output path for the part.
+        """
+        return Path(folder) / str(self.year) / f"{self.day:02d}" / self.method_name
+
+    def __str__(self) -> str:
+        return f"{self.year}/{self.day:02d} {self.method_name}"
+
+
+@dataclass
+class PartResult:
+    """Result of running a single unit."""
+
+    unit: Unit
+    answer: str | None = None
+    parse_seconds: float = 0
+    run_seconds: float = 0
+    error: str | None = None
+    memory: MemoryReport | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the unit ran without errors."""
+        return self.error is None
+
+
+def parse_range(value: str) -> list[int]:
+    """Parse a range specification such as `1-5,7,9-12` into its sorted values.
+
+    Args:
+        value (str): Range specification.
+
+    Returns:
+        list[int]: All values covered by the specification.
+    """
+    res: set[int] = set()
+
+    for chunk in value.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+
+        if "-" in chunk:
+            start, end = chunk.split("-")
+            res.update(range(int(start), int(end) + 1))
+
+        else:
+            res.add(int(chunk))
+
+    return sorted(res)
+
+
+def discover_days(year: int) -> list[int]:
+    """Find all days of the given year that have a solution module.
+
+    Args:
+        year (int): Year of the event.
+
+    Returns:
+        list[int]: Days with a solution.
+    """
+    year_path: Path = SOLUTIONS_PATH / str(year)
+
+    if not year_path.exists():
+        return []
+
+    return sorted(
+        int(folder.name)
+        for folder in year_path.iterdir()
+        if folder.name.isdigit() and (folder / f"day{folder.name}.py").is_file()
+    )
+
+
+def discover_units(year: int, days: list[int], parts: list[int]) -> list[Unit]:
+    """Build all the units for the given days, keeping only the parts the solutions implement.
+
+    Args:
+        year (int): Year of the event.
+        days (list[int]): Days to include.
+        parts (list[int]): Parts to include.
+
+    Returns:
+        list[Unit]: Units to run.
+    """
+    res: list[Unit] = []
+
+    for day in days:
+        solution: type | None = None
+
+        try:
+            solution = load_solution(unit=Unit(year=year, day=day, part=1))
+
+        except Exception:
+            # keep every part so the failure is reported per unit
+            pass
+
+        for part in parts:
+            unit: Unit = Unit(year=year, day=day, part=part)
+
+            if solution is None or hasattr(solution, unit.method_name):
+                res.append(unit)
+
+    return res
+
+
+def load_solution(unit: Unit) -> type:
+    """Import the module of the unit and return its `Solution` class.
+
+    Args:
+        unit (Unit): Unit to load the solution for.
+
+    Returns:
+        type: The `Solution` class of the quest.
+    """
+    module = importlib.import_module(unit.module_name)
+
+    if not hasattr(module, "Solution"):
+        raise AttributeError(f"No `Solution` class found in `{unit.module_name}`.")
+
+    return module.Solution
+
+
+def parse_answer(output: str) -> str:
+    """Extract the answer from the printed output of a part, e.g. `Part 01: 42`.
+
+    Args:
+        output (str): Captured output of the part.
+
+    Returns:
+        str: The answer.
+    """
+    lines: list[str] = [line for line in output.strip().splitlines() if line.strip()]
+
+    if not lines:
+        return ""
+
+    _, sep, answer = lines[-1].partition(":")
+    return answer.strip() if sep else lines[-1].strip()
+
+
+def run_unit(
+    unit: Unit,
+    inputs: str,
+    memory: bool = False,
+    top: int = 0,
+    profile: str | None = None,
+) -> PartResult:
+    """Parse the input of the unit and run its part, capturing the answer and timings.
+
+    Args:
+        unit (Unit): Unit to run.
+        inputs (str): Root folder of the input files.
+        memory (bool): Whether to trace the memory used while parsing and running. Default is FALSE.
+        top (int): Number of top allocation sites to report when tracing memory. Default is `0`.
+        profile (str | None): Folder to write a profile of the part to. Default is no profiling.
+
+    Returns:
+        PartResult: Outcome of the unit.
+    """
+    result: PartResult = PartResult(unit=unit)
+
+    try:
+        solution: type = load_solution(unit=unit)
+
+        with contextlib.ExitStack() as stack:
+            if memory:
+                result.memory = stack.enter_context(track_memory(top=top))
+
+            start: float = time.perf_counter()
+            instance = solution.parse(str(unit.input_path(inputs=inputs)))
+            result.parse_seconds = time.perf_counter() - start
+
+            output: io.StringIO = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                start = time.perf_counter()
+                if profile is None:
+                    getattr(instance, unit.method_name)()
+
+                else:
+                    profile_call(
+                        func=getattr(instance, unit.method_name),
+                        output=unit.output_path(folder=profile),
+                    )
+                result.run_seconds = time.perf_counter() - start
+
+        result.answer = parse_answer(output=output.getvalue())
+
+    except Exception as ex:
+        result.error = f"{type(ex).__name__}: {ex}"
+
+    return result
+
+
+def run_units(
+    units: list[Unit],
+    inputs: str,
+    jobs: int | None = None,
+    memory: bool = False,
+    top: int = 0,
+    profile: str | None = None,
+) -> list[PartResult]:
+    """Run all units across a process pool, keeping the order of the given units.
+
+    Args:
+        units (list[Unit]): Units to run.
+        inputs (str): Root folder of the input files.
+        jobs (int | None): Number of worker processes. Default is the CPU count.
+        memory (bool): Whether to trace the memory of each unit. Each unit then runs in a fresh process, so that the
+            peak RSS belongs to that unit alone. Default is FALSE.
+        top (int): Number of top allocation sites to report when tracing memory. Default is `0`.
+        profile (str | None): Folder to write a profile of each unit to. Default is no profiling.
+
+    Returns:
+        list[PartResult]: Results of each unit.
+    """
+    n: int = len(units)
+
+    if jobs == 1 and not memory:
+        return [run_unit(unit=unit, inputs=inputs, profile=profile) for unit in units]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, max_tasks_per_child=1 if memory else None
+    ) as executor:
+        return list(
+            executor.map(
+                run_unit, units, [inputs] * n, [memory] * n, [top] * n, [profile] * n
+            )
+        )
+
+
+def report(results: list[PartResult]) -> None:
+    """Print the results as a table."""
+    for result in results:
+        if not result.ok:
+            print(f"{result.unit}: {result.error}")
+            continue
+
+        print(
+            f"{result.unit}: {result.answer:<20} "
+            f"parse={Timing(result.parse_seconds).result()} "
+            f"run={Timing(result.run_seconds).result()}"
+        )
+
+        if result.memory is not None:
+            print(f"    {result.memory}")
+
+            for site in result.memory.top_allocations:
+                print(f"        {site}")
+
+
+def main() -> None:
+    """Entry point."""
+    args = PARSER.parse_args()
+
+    year: int = int(args.year)
+    days: list[int] = parse_range(args.days) if args.days else discover_days(year=year)
+    parts: list[int] = parse_range(args.parts)
+    jobs: int = args.jobs if args.jobs else os.cpu_count() or 1
+
+    units: list[Unit] = discover_units(year=year, days=days, parts=parts)
+
+    start: float = time.perf_counter()
+    results: list[PartResult] = run_units(
+        units=units,
+        inputs=args.inputs,
+        jobs=jobs,
+        memory=args.memory,
+        top=args.top,
+        profile=args.profile_dir if args.profile else None,
+    )
+    elapsed: float = time.perf_counter() - start
+
+    report(results=results)
+
+    if args.profile:
+        print(f"\nWrote profiles to `{args.profile_dir}`.")
+
+    print(
+        f"\nRan {len(results)} parts on {jobs} workers in {Timing(elapsed).result()} "
+        f"(serial total {Timing(sum(r.parse_seconds + r.run_seconds for r in results)).result()})."
+    )
+
+
+if __name__ == "__main__":
+    main()
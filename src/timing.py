@@ -2,6 +2,7 @@
 # MilaDog
 
 import math as _math
+import statistics as _statistics
 from enum import Enum
 from typing import Union
 
@@ -61,6 +62,18 @@ class Timing:
     def result(self):
         return "{:.5f}".format(self._seconds_raw) + "s"
 
+    def scaled(self, digits: int = 3):
+        """Get the value in the largest unit of which it is at least one, so short timings keep their precision"""
+        for symbol, value in (
+            (TimingSymbols.SECONDS, self._seconds_raw),
+            (TimingSymbols.MILLISECONDS, self._milliseconds_raw),
+            (TimingSymbols.MICROSECONDS, self._microseconds_raw),
+        ):
+            if abs(value) >= 1:
+                return "{:.{}f}{}".format(value, digits, symbol.value)
+
+        return "{:.0f}{}".format(self._nanoseconds_raw, TimingSymbols.NANOSECONDS.value)
+
     @property
     def seconds(self):
         """Get seconds value"""
@@ -100,3 +113,103 @@ class Timing:
     def nanoseconds_raw(self):
         """Get nanoseconds raw value"""
         return self._nanoseconds_raw
+
+
+class TimingStatistics:
+    """Summary statistics over repeated timing samples, each reported as a `Timing`."""
+
+    def __init__(self, samples_ns: list[int]):
+        if not samples_ns:
+            raise ValueError("At least one timing sample is required.")
+
+        self._samples_ns: list[int] = sorted(samples_ns)
+
+    @staticmethod
+    def _to_timing(nanoseconds: Union[int, float]) -> Timing:
+        """Convert nanoseconds into a `Timing`."""
+        return Timing(nanoseconds / 1e9)
+
+    def __str__(self):
+        """Get the string representation of the object"""
+        return "min=%s; median=%s; mean=%s; p95=%s; stddev=%s (n=%d)" % (
+            self.min.scaled(),
+            self.median.scaled(),
+            self.mean.scaled(),
+            self.p95.scaled(),
+            self.stddev.scaled(),
+            self.count,
+        )
+
+    def percentile(self, percent: float) -> Timing:
+        """Get the nearest-rank percentile of the samples.
+
+        Args:
+            percent (float): Percentile to get, within [0, 100].
+
+        Returns:
+            Timing: Sample at the percentile.
+        """
+        return self._to_timing(self._percentile_ns(percent=percent))
+
+    def _percentile_ns(self, percent: float) -> int:
+        """Get the nearest-rank percentile of the samples in nanoseconds."""
+        rank: int = _math.ceil(percent / 100 * self.count)
+        return self._samples_ns[max(rank, 1) - 1]
+
+    def _stddev_ns(self) -> float:
+        """Get the sample standard deviation in nanoseconds."""
+        if self.count < 2:
+            return 0
+
+        return _statistics.stdev(self._samples_ns)
+
+    def as_dict(self) -> dict[str, Union[int, float]]:
+        """Get the statistics in nanoseconds, for machine-readable output."""
+        return {
+            "count": self.count,
+            "min_ns": self._samples_ns[0],
+            "median_ns": _statistics.median(self._samples_ns),
+            "mean_ns": _statistics.fmean(self._samples_ns),
+            "p95_ns": self._percentile_ns(percent=95),
+            "stddev_ns": self._stddev_ns(),
+        }
+
+    @property
+    def samples_ns(self):
+        """Get the sorted samples in nanoseconds"""
+        return self._samples_ns
+
+    @property
+    def count(self):
+        """Get number of samples"""
+        return len(self._samples_ns)
+
+    @property
+    def min(self):
+        """Get fastest sample"""
+        return self._to_timing(self._samples_ns[0])
+
+    @property
+    def max(self):
+        """Get slowest sample"""
+        return self._to_timing(self._samples_ns[-1])
+
+    @property
+    def median(self):
+        """Get median sample"""
+        return self._to_timing(_statistics.median(self._samples_ns))
+
+    @property
+    def mean(self):
+        """Get mean of the samples"""
+        return self._to_timing(_statistics.fmean(self._samples_ns))
+
+    @property
+    def p95(self):
+        """Get 95th percentile sample"""
+        return self.percentile(95)
+
+    @property
+    def stddev(self):
+        """Get sample standard deviation"""
+        return self._to_timing(self._stddev_ns())